@@ -1,75 +1,22 @@
 #Author: Mehrnoush Vaseghipanah
 # Research paper
-import random
-
-def generate_attacker_strength(difficulty):
-  """
-  Generates attacker strength based on difficulty level (1-low, 3-high).
-  """
-  return random.randint(10 * difficulty, 30 * difficulty)
-
-def generate_defender_cybersecurity(training, awareness):
-  """
-  Calculates defender's cybersecurity readiness based on training and awareness.
-  """
-  cybersecurity = (training * 0.7) + (awareness * 0.3)
-  return min(100, cybersecurity)  # Clamp value between 0 and 100
-
-def generate_defender_forensics(experience, procedures):
-  """
-  Calculates defender's digital forensics readiness based on experience and procedures.
-  """
-  forensics = (experience * 0.8) + (procedures * 0.2)
-  return min(100, forensics)  # Clamp value between 0 and 100
-
-def simulate_attack(attacker_strength, defender_cybersecurity):
-  """
-  Simulates the attack and determines success based on attacker strength vs defender's cybersecurity.
-  """
-  breach_chance = attacker_strength / (defender_cybersecurity + 1)
-  return random.random() < breach_chance  # Random value less than breach_chance indicates successful attack
-
-def analyze_evidence(defender_forensics, evidence_complexity):
-  """
-  Simulates digital forensics investigation and determines evidence collection success.
-  """
-  collection_chance = defender_forensics / (evidence_complexity + 1)
-  return random.random() < collection_chance  # Random value less than collection_chance indicates successful collection
-
-def run_simulation(difficulty):
-  """
-  Runs a single simulation round with attacker and defender actions.
-  """
-  attacker_strength = generate_attacker_strength(difficulty)
-  defender_cybersecurity = generate_defender_cybersecurity(training=80, awareness=70)  # Sample values
-  defender_forensics = generate_defender_forensics(experience=60, procedures=90)  # Sample values
-
-  # Simulate attack
-  attack_successful = simulate_attack(attacker_strength, defender_cybersecurity)
-
-  # Simulate forensics investigation (if attack successful)
-  evidence_collected = None
-  if attack_successful:
-    evidence_complexity = random.randint(50, 80)  # Random complexity for evidence
-    evidence_collected = analyze_evidence(defender_forensics, evidence_complexity)
-
-  return attack_successful, evidence_collected
+from dfr.evidence_batch import estimate_rates, exact_rates
 
 def main():
-  # Run multiple simulations and track results
-  num_simulations = 1000
-  attack_success_count = 0
-  evidence_collected_count = 0
-  for _ in range(num_simulations):
-    attack_successful, evidence_collected = run_simulation(difficulty=3)  # Sample difficulty
-    attack_success_count += attack_successful
-    if evidence_collected is not None:
-      evidence_collected_count += evidence_collected
+  # Simulate trials in batches until both 95% confidence intervals are at most 0.02 wide
+  results = estimate_rates(difficulty=3, confidence=0.95, target_width=0.02)  # Sample difficulty
 
   # Print simulation results
-  print("Simulation Results:")
-  print(f"Attack Success Rate: {attack_success_count / num_simulations:.2f}")
-  print(f"Evidence Collection Rate (on successful attacks): {evidence_collected_count / attack_success_count:.2f} (if applicable)")
+  attack_low, attack_high = results["attack_success_rate_interval"]
+  evidence_low, evidence_high = results["evidence_collection_rate_interval"]
+  print(f"Simulation Results ({results['n_trials']} trials):")
+  print(f"Attack Success Rate: {results['attack_success_rate']:.2f} (95% CI {attack_low:.3f}-{attack_high:.3f})")
+  print(f"Evidence Collection Rate (on successful attacks): {results['evidence_collection_rate']:.2f} (95% CI {evidence_low:.3f}-{evidence_high:.3f}) (if applicable)")
+
+  # Cross-check against the exact rates
+  exact = exact_rates(difficulty=3)
+  print(f"Exact Attack Success Rate: {exact['attack_success_rate']:.3f} (inside CI: {attack_low <= exact['attack_success_rate'] <= attack_high})")
+  print(f"Exact Evidence Collection Rate: {exact['evidence_collection_rate']:.3f} (inside CI: {evidence_low <= exact['evidence_collection_rate'] <= evidence_high})")
 
 if __name__ == "__main__":
   main()
@@ -0,0 +1,5 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Importable building blocks for the DFR simulation scripts.
+"""
@@ -0,0 +1,127 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Time-stepped attacker/defender campaigns.
+
+Every step each campaign runs one pass of the kill chain (dfr.kill_chain), whose
+develop_resources() stage grows the attacker resources carried into the next
+step. The defender hardens every step (harden()) and, after an attack that
+delivered impact, pays the recovery cost of restore(). Posture is recomputed
+from the hardening level with calculate_defender_posture().
+
+The hardening level is the defender's cybersecurity on a 0-1 scale, which is
+the scale of harden()'s 2%-10% increases and restore()'s 2%-5% reductions;
+restore() reads it with scale=1 so its 0-100 membership sets see the same
+posture, and a well-hardened defender recovers at a lower cost.
+Campaign state lives in one structured array of float32 fields and the
+optional history in (steps, campaigns) float32 arrays.
+"""
+import numpy as np
+import pandas as pd
+
+from dfr.attacker_tactics import calculate_defender_posture
+from dfr.defender_batch import harden, restore
+from dfr.kill_chain import STAGE_NAMES, run_campaigns
+
+CAMPAIGN_DTYPE = np.dtype([
+    ("attacker_resources", np.float32),
+    ("attacker_motivation", np.float32),
+    ("training", np.float32),
+    ("awareness", np.float32),
+    ("hardening_level", np.float32),
+    ("defender_posture", np.float32),
+    ("impacts", np.int32),
+])
+HISTORY_FIELDS = ("attacker_resources", "hardening_level", "defender_posture")
+_IMPACT = STAGE_NAMES.index("deliver_impact")
+
+
+def initial_state(n_campaigns, attacker_resources=30, attacker_motivation=70, training=80, awareness=70,
+                  hardening_level=0.0):
+    """
+    Campaign state array; every argument may be a scalar or an (n_campaigns,) array.
+    """
+    state = np.zeros(n_campaigns, dtype=CAMPAIGN_DTYPE)
+    state["attacker_resources"] = attacker_resources
+    state["attacker_motivation"] = attacker_motivation
+    state["training"] = training
+    state["awareness"] = awareness
+    state["hardening_level"] = hardening_level
+    state["defender_posture"] = calculate_defender_posture(state["training"], state["awareness"],
+                                                           state["hardening_level"])
+    return state
+
+
+def step(state, rng):
+    """
+    Advances every campaign by one time step in place.
+
+    Returns:
+        ndarray: Boolean impact delivered per campaign in this step.
+    """
+    # Defender hardens, then faces one attack at the resulting posture
+    hardening_level = np.minimum(state["hardening_level"] + harden(state["training"], state["awareness"], rng), 1)
+    posture = calculate_defender_posture(state["training"], state["awareness"], hardening_level)
+
+    result = run_campaigns(len(state), posture, state["attacker_resources"], state["attacker_motivation"], rng=rng)
+    impact = result["outcomes"][:, _IMPACT]
+
+    # Recovery after delivered impact lowers the hardening level
+    hardening_level = np.where(impact, np.maximum(restore(hardening_level, rng, scale=1), 0), hardening_level)
+    state["hardening_level"] = hardening_level
+    state["defender_posture"] = calculate_defender_posture(state["training"], state["awareness"], hardening_level)
+    # Resources are a level between 0 and 100
+    state["attacker_resources"] = np.minimum(result["attacker_resources"], 100)
+    state["impacts"] += impact
+    return impact
+
+
+def simulate_campaigns(n_campaigns, n_steps, rng=None, record_history=True, **initial):
+    """
+    Runs n_campaigns concurrent campaigns for n_steps time steps.
+
+    Args:
+        n_campaigns (int): Number of campaigns.
+        n_steps (int): Number of time steps.
+        rng: numpy Generator or seed for every random draw.
+        record_history (bool): Keep the (n_steps, n_campaigns) history of HISTORY_FIELDS
+            and impacts; the per-step summary is always kept.
+        **initial: Initial state, see initial_state().
+
+    Returns:
+        dict: Final "state", per-step "summary" DataFrame (mean resources, hardening and
+        posture, impact rate) and, with record_history, "history".
+    """
+    rng = np.random.default_rng(rng)
+    state = initial_state(n_campaigns, **initial)
+    history = None
+    if record_history:
+        history = {name: np.empty((n_steps, n_campaigns), dtype=np.float32) for name in HISTORY_FIELDS}
+        history["impact"] = np.empty((n_steps, n_campaigns), dtype=bool)
+    summary = np.empty((n_steps, len(HISTORY_FIELDS) + 1))
+
+    for t in range(n_steps):
+        impact = step(state, rng)
+        for i, name in enumerate(HISTORY_FIELDS):
+            summary[t, i] = state[name].mean()
+            if history is not None:
+                history[name][t] = state[name]
+        summary[t, -1] = impact.mean()
+        if history is not None:
+            history["impact"][t] = impact
+
+    summary = pd.DataFrame(summary, columns=[name + "_mean" for name in HISTORY_FIELDS] + ["impact_rate"])
+    summary.index.name = "step"
+    result = {"state": state, "summary": summary}
+    if history is not None:
+        result["history"] = history
+    return result
+
+
+def main():
+    result = simulate_campaigns(20_000, 200, rng=0, attacker_resources=20, hardening_level=0.1)
+    print(result["summary"].iloc[::20].to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Array versions of the D3FEND defender tactics (defender-tactics.py).
+
+Each function evaluates the same membership and effect formulas as its scalar
+counterpart for whole arrays of defenders, drawing from a numpy Generator
+instead of the random module. defend() chains them into the D3FEND pipeline
+Harden -> Detect -> Isolate -> Deceive -> Evict -> Restore over arrays of
+defender/attacker pairs, one intrusion per pair.
+"""
+import numpy as np
+
+# Tactics of defend() in pipeline order
+PLAYBOOK = ("harden", "detect", "isolate", "deceive", "evict", "restore")
+# Membership sets the tactic functions read (the low and medium triangles)
+_SECURITY_SETS = ((0, 20, 50), (30, 60, 90))
+_STRENGTH_SETS = ((0, 20, 50), (30, 60, 90))
+
+
+def _ramp(values, low_set, mid_set):
+    # min(max(0, (x - low[0]) / (mid[0] - low[0])), 1), the branch the tactic functions take
+    return np.minimum(np.maximum(0, (values - low_set[0]) / (mid_set[0] - low_set[0])), 1)
+
+
+def harden(training, awareness, rng):
+    """
+    Array version of harden(): cybersecurity increase from training and awareness.
+
+    Args:
+        training (ndarray): Level of defender training (0-100).
+        awareness (ndarray): Level of defender awareness (0-100).
+        rng (Generator): Random number generator.
+
+    Returns:
+        ndarray: Increase between 2% and 10% scaled by the hardening factor.
+    """
+    train_value = _ramp(np.asarray(training, dtype=np.float64), (0, 20, 50), (30, 60, 90))
+    exp_value = _ramp(np.asarray(awareness, dtype=np.float64), (0, 2, 5), (3, 7, 10))
+    hardening_factor = (train_value + exp_value) / 2
+    return rng.uniform(0.02 * hardening_factor, 0.1 * hardening_factor)
+
+
+def detect(cybersecurity, rng):
+    """
+    Array version of detect(): whether each ongoing attack is detected.
+
+    Args:
+        cybersecurity (ndarray): Defender's current cybersecurity level.
+        rng (Generator): Random number generator.
+
+    Returns:
+        ndarray: Boolean detection per defender, with chance security_value**2.
+    """
+    security_value = _ramp(np.asarray(cybersecurity, dtype=np.float64), *_SECURITY_SETS)
+    return rng.random(security_value.shape) < security_value ** 2
+
+
+def isolate(cybersecurity, attacker_strength, rng):
+    """
+    Array version of isolate(): attacker strength after isolation.
+
+    Args:
+        cybersecurity (ndarray): Defender's current cybersecurity level.
+        attacker_strength (ndarray): Attacker's strength.
+        rng (Generator): Random number generator.
+
+    Returns:
+        ndarray: Attacker strength reduced by up to 30% of the isolation effectiveness.
+    """
+    attacker_strength = np.asarray(attacker_strength, dtype=np.float64)
+    security_value = _ramp(np.asarray(cybersecurity, dtype=np.float64), *_SECURITY_SETS)
+    strength_value = _ramp(attacker_strength, *_STRENGTH_SETS)
+    isolation_effectiveness = (security_value + (1 - strength_value)) / 2
+    return attacker_strength - rng.uniform(0, isolation_effectiveness * 0.3)
+
+
+def deceive(cybersecurity, rng):
+    """
+    Array version of deceive(): attacker strength reduction from deception.
+
+    Args:
+        cybersecurity (ndarray): Defender's current cybersecurity level.
+        rng (Generator): Random number generator.
+
+    Returns:
+        ndarray: Reduction of up to 10% of the deception effectiveness (security_value**1.5).
+    """
+    security_value = _ramp(np.asarray(cybersecurity, dtype=np.float64), *_SECURITY_SETS)
+    return rng.uniform(0, security_value ** 1.5 * 0.1)
+
+
+def eviction_succeeds(cybersecurity, attacker_strength, rng):
+    """
+    Eviction draw of evict(): whether each eviction attempt succeeds.
+
+    Args:
+        cybersecurity (ndarray): Defender's current cybersecurity level.
+        attacker_strength (ndarray): Attacker's strength.
+        rng (Generator): Random number generator.
+
+    Returns:
+        ndarray: Boolean success per defender, with chance security_value * (1 - strength_value).
+    """
+    attacker_strength = np.asarray(attacker_strength, dtype=np.float64)
+    security_value = _ramp(np.asarray(cybersecurity, dtype=np.float64), *_SECURITY_SETS)
+    strength_value = _ramp(attacker_strength, *_STRENGTH_SETS)
+    eviction_chance = security_value * (1 - strength_value)
+    return rng.random(attacker_strength.shape) < eviction_chance
+
+
+def evict(cybersecurity, attacker_strength, rng):
+    """
+    Array version of evict(): attacker strength after the eviction attempt.
+
+    Args:
+        cybersecurity (ndarray): Defender's current cybersecurity level.
+        attacker_strength (ndarray): Attacker's strength.
+        rng (Generator): Random number generator.
+
+    Returns:
+        ndarray: 0 where eviction succeeds, attacker_strength otherwise.
+    """
+    attacker_strength = np.asarray(attacker_strength, dtype=np.float64)
+    return np.where(eviction_succeeds(cybersecurity, attacker_strength, rng), 0, attacker_strength)
+
+
+def restore(cybersecurity, rng, scale=100):
+    """
+    Array version of restore(): cybersecurity after the recovery effort.
+
+    Args:
+        cybersecurity (ndarray): Defender's cybersecurity level before the attack.
+        rng (Generator): Random number generator.
+        scale (float): Top of the cybersecurity scale; the membership sets are on 0-100,
+            so a 0-1 level (as in dfr.campaign_simulator) passes scale=1.
+
+    Returns:
+        ndarray: Cybersecurity reduced by 2% to 5% of the recovery effort.
+    """
+    cybersecurity = np.asarray(cybersecurity, dtype=np.float64)
+    security_value = _ramp(cybersecurity * (100 / scale), *_SECURITY_SETS)
+    recovery_effort = 1 - security_value ** 0.5
+    return cybersecurity - rng.uniform(0.02 * recovery_effort, 0.05 * recovery_effort)
+
+
+def defend(cybersecurity, attacker_strength, training, awareness, rng=None, playbook=PLAYBOOK,
+           chunk_size=1_000_000):
+    """
+    Runs one intrusion per defender/attacker pair through the D3FEND pipeline.
+
+    The defender hardens, then tries to detect the intrusion. Only detected intrusions
+    are contained: isolate() and deceive() weaken the attacker and evict() may remove
+    it. Intrusions the attacker was not evicted from cost the recovery of restore().
+    Tactics left out of the playbook are skipped; without "detect" nothing is contained.
+
+    Args:
+        cybersecurity (float or ndarray): Defender's cybersecurity level (0-100).
+        attacker_strength (float or ndarray): Attacker's strength (0-100).
+        training (float or ndarray): Level of defender training (0-100).
+        awareness (float or ndarray): Level of defender awareness (0-100).
+        rng: numpy Generator or seed shared by every tactic.
+        playbook (tuple): Tactics of PLAYBOOK to apply.
+        chunk_size (int): Intrusions evaluated together, bounding memory use.
+
+    Returns:
+        dict: "cybersecurity" and "attacker_strength" after the pipeline, boolean
+        "detected" and "evicted", one entry per pair.
+    """
+    for tactic in playbook:
+        if tactic not in PLAYBOOK:
+            raise ValueError(f"Invalid tactic '{tactic}'. Choose from {', '.join(PLAYBOOK)}.")
+    rng = np.random.default_rng(rng)
+    arrays = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64)
+                                   for value in (cybersecurity, attacker_strength, training, awareness)))
+    n = arrays[0].size
+    cybersecurity, attacker_strength, training, awareness = (array.ravel() for array in arrays)
+    result = {"cybersecurity": np.empty(n), "attacker_strength": np.empty(n),
+              "detected": np.zeros(n, dtype=bool), "evicted": np.zeros(n, dtype=bool)}
+
+    for start in range(0, n, chunk_size):
+        chunk = slice(start, min(start + chunk_size, n))
+        security = cybersecurity[chunk]
+        strength = attacker_strength[chunk]
+        if "harden" in playbook:
+            security = security + harden(training[chunk], awareness[chunk], rng)
+        detected = detect(security, rng) if "detect" in playbook else np.zeros(len(security), dtype=bool)
+        if "isolate" in playbook:
+            strength = np.where(detected, isolate(security, strength, rng), strength)
+        if "deceive" in playbook:
+            strength = np.where(detected, strength - deceive(security, rng), strength)
+        evicted = np.zeros(len(security), dtype=bool)
+        if "evict" in playbook:
+            # The success draw itself: an attacker already at strength 0 is not evicted by it
+            evicted = detected & eviction_succeeds(security, strength, rng)
+            strength = np.where(evicted, 0, strength)
+        if "restore" in playbook:
+            security = np.where(evicted, security, restore(security, rng))
+        result["cybersecurity"][chunk] = security
+        result["attacker_strength"][chunk] = strength
+        result["detected"][chunk] = detected
+        result["evicted"][chunk] = evicted
+
+    shape = arrays[0].shape
+    return {name: values.reshape(shape) for name, values in result.items()}
+
+
+def main():
+    rng = np.random.default_rng(0)
+    n_intrusions = 1_000_000
+    cybersecurity = rng.uniform(0, 100, n_intrusions)
+    attacker_strength = rng.uniform(0, 100, n_intrusions)
+    training = rng.uniform(0, 100, n_intrusions)
+    awareness = rng.uniform(0, 10, n_intrusions)
+    playbooks = {
+        "full": PLAYBOOK,
+        "no deception": tuple(tactic for tactic in PLAYBOOK if tactic != "deceive"),
+        "detect and evict": ("harden", "detect", "evict", "restore"),
+    }
+    for name, playbook in playbooks.items():
+        result = defend(cybersecurity, attacker_strength, training, awareness, rng=rng, playbook=playbook)
+        print(f"{name}: detected {result['detected'].mean():.3f}, evicted {result['evicted'].mean():.3f}, "
+              f"mean attacker strength {result['attacker_strength'].mean():.2f}, "
+              f"mean cybersecurity {result['cybersecurity'].mean():.2f}")
+
+
+if __name__ == "__main__":
+    main()
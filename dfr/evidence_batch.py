@@ -0,0 +1,208 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Batched Monte Carlo estimator for attack-success-rate-evidence-collection.py.
+
+All trials of a batch draw their attacker strength, breach outcome and evidence
+collection from one numpy Generator at once. The attack success and evidence
+collection rates come with Wilson or bootstrap confidence intervals, and with a
+target interval width the estimator keeps adding batches only until both
+intervals are narrow enough. exact_rates() gives the same rates analytically,
+as a cross-check of the Monte Carlo path.
+"""
+from statistics import NormalDist
+
+import numpy as np
+
+from dfr.evidence_collection import generate_defender_cybersecurity, generate_defender_forensics
+
+_INTERVALS = ("wilson", "bootstrap")
+
+
+def simulate_trials(n_trials, difficulty=3, training=80, awareness=70, experience=60, procedures=90,
+                    complexity_range=(50, 80), rng=None):
+    """
+    Array version of run_simulation() for n_trials independent trials.
+
+    Args:
+        n_trials (int): Number of trials.
+        difficulty (int): Difficulty level (1-low, 3-high).
+        training, awareness (int): Defender cybersecurity inputs (0-100).
+        experience, procedures (int): Defender forensics inputs (0-100).
+        complexity_range (tuple): Inclusive range of the evidence complexity.
+        rng: numpy Generator or seed for the random draws.
+
+    Returns:
+        tuple: (attack_successful, evidence_collected) boolean arrays. Evidence is only
+        collected in trials with a successful attack.
+    """
+    rng = np.random.default_rng(rng)
+    defender_cybersecurity = generate_defender_cybersecurity(training, awareness)
+    defender_forensics = generate_defender_forensics(experience, procedures)
+
+    attacker_strength = rng.integers(10 * difficulty, 30 * difficulty, n_trials, endpoint=True)
+    attack_successful = rng.random(n_trials) < attacker_strength / (defender_cybersecurity + 1)
+
+    evidence_complexity = rng.integers(complexity_range[0], complexity_range[1], n_trials, endpoint=True)
+    collected = rng.random(n_trials) < defender_forensics / (evidence_complexity + 1)
+    return attack_successful, attack_successful & collected
+
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """
+    Wilson score interval of a binomial proportion.
+
+    Args:
+        successes (int or ndarray): Number of successes.
+        trials (int or ndarray): Number of trials; no trials gives the interval (0, 1).
+        confidence (float): Confidence level.
+
+    Returns:
+        tuple: (low, high) bounds.
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    successes = np.asarray(successes, dtype=np.float64)
+    trials = np.asarray(trials, dtype=np.float64)
+    n = np.maximum(trials, 1)
+    p = successes / n
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    # All failures or all successes pin the bound exactly (and no trials give (0, 1))
+    low = np.where(successes > 0, np.maximum(center - half_width, 0), 0.0)
+    high = np.where(successes < trials, np.minimum(center + half_width, 1), 1.0)
+    return low[()], high[()]
+
+
+def bootstrap_interval(successes, trials, confidence=0.95, n_resamples=2000, rng=None):
+    """
+    Percentile bootstrap interval of a binomial proportion.
+
+    Resampling trials 0/1 outcomes with replacement gives a Binomial(trials, successes /
+    trials) number of successes, so each resample is one binomial draw instead of a
+    resampled array.
+
+    Args:
+        successes (int): Number of successes.
+        trials (int): Number of trials; no trials gives the interval (0, 1).
+        confidence (float): Confidence level.
+        n_resamples (int): Number of bootstrap resamples.
+        rng: numpy Generator or seed for the resampling.
+
+    Returns:
+        tuple: (low, high) bounds.
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    rng = np.random.default_rng(rng)
+    resampled = rng.binomial(trials, successes / trials, n_resamples) / trials
+    low, high = np.quantile(resampled, [0.5 - confidence / 2, 0.5 + confidence / 2])
+    return float(low), float(high)
+
+
+def estimate_rates(difficulty=3, n_trials=1000, confidence=0.95, interval="wilson", target_width=None,
+                   batch_size=10_000, max_trials=10_000_000, rng=None, **defender):
+    """
+    Monte Carlo estimate of the attack success and evidence collection rates.
+
+    Args:
+        difficulty (int): Difficulty level (1-low, 3-high).
+        n_trials (int): Number of trials when no target_width is given.
+        confidence (float): Confidence level of the intervals.
+        interval (str): "wilson" or "bootstrap".
+        target_width (float): Adaptive stopping: keep simulating batches of batch_size
+            until both intervals are at most this wide, or max_trials is reached.
+        batch_size (int): Trials per batch in adaptive mode.
+        max_trials (int): Upper bound on the trials in adaptive mode.
+        rng: numpy Generator or seed for every random draw.
+        **defender: training, awareness, experience, procedures and complexity_range,
+            see simulate_trials().
+
+    Returns:
+        dict: attack_success_rate and evidence_collection_rate (on successful attacks, nan
+        without any) with their (low, high) intervals under name + "_interval", the
+        number of trials, successful attacks and collected evidence, and whether the
+        target width was reached.
+    """
+    if interval not in _INTERVALS:
+        raise ValueError("Invalid interval. Choose 'wilson' or 'bootstrap'.")
+    rng = np.random.default_rng(rng)
+    trials = attacks = evidence = 0
+    while True:
+        size = n_trials if target_width is None else min(batch_size, max_trials - trials)
+        attack_successful, evidence_collected = simulate_trials(size, difficulty, rng=rng, **defender)
+        trials += size
+        attacks += int(np.count_nonzero(attack_successful))
+        evidence += int(np.count_nonzero(evidence_collected))
+
+        if interval == "wilson":
+            attack_interval = wilson_interval(attacks, trials, confidence)
+            evidence_interval = wilson_interval(evidence, attacks, confidence)
+        else:
+            attack_interval = bootstrap_interval(attacks, trials, confidence, rng=rng)
+            evidence_interval = bootstrap_interval(evidence, attacks, confidence, rng=rng)
+        width = max(attack_interval[1] - attack_interval[0], evidence_interval[1] - evidence_interval[0])
+        converged = target_width is not None and width <= target_width
+        if target_width is None or converged or trials >= max_trials:
+            break
+
+    return {
+        "attack_success_rate": attacks / trials,
+        "attack_success_rate_interval": tuple(float(bound) for bound in attack_interval),
+        "evidence_collection_rate": evidence / attacks if attacks else float("nan"),
+        "evidence_collection_rate_interval": tuple(float(bound) for bound in evidence_interval),
+        "n_trials": trials,
+        "n_attacks": attacks,
+        "n_evidence_collected": evidence,
+        "converged": converged,
+    }
+
+
+def _uniform_mean(low, high, probability):
+    """
+    Mean of probability(value) over the integers low..high (inclusive), broadcast over
+    arrays of bounds. probability receives the values on a trailing axis.
+    """
+    low = np.asarray(low)
+    high = np.asarray(high)
+    if np.any(high < low):
+        raise ValueError("Invalid range. The upper bound must not be below the lower bound.")
+    values = low[..., None] + np.arange(int(np.max(high - low)) + 1)
+    inside = values <= high[..., None]
+    total = np.sum(np.where(inside, probability(values), 0.0), axis=-1)
+    return total / (high - low + 1)
+
+
+def exact_rates(difficulty=3, training=80, awareness=70, experience=60, procedures=90, complexity_range=(50, 80)):
+    """
+    Exact attack success and evidence collection rates of run_simulation().
+
+    Both outcomes are Bernoulli trials on a uniform integer (attacker strength and evidence
+    complexity), so each rate is the mean of the clamped success chance over that range.
+    Every argument may be an array; the arrays are broadcast against each other.
+
+    Args:
+        difficulty (int): Difficulty level (1-low, 3-high).
+        training, awareness (int): Defender cybersecurity inputs (0-100).
+        experience, procedures (int): Defender forensics inputs (0-100).
+        complexity_range (tuple): Inclusive (low, high) range of the evidence complexity.
+
+    Returns:
+        dict: attack_success_rate and evidence_collection_rate (on successful attacks).
+    """
+    difficulty = np.asarray(difficulty)
+    defender_cybersecurity = np.minimum(100, np.asarray(training) * 0.7 + np.asarray(awareness) * 0.3)
+    defender_forensics = np.minimum(100, np.asarray(experience) * 0.8 + np.asarray(procedures) * 0.2)
+    complexity_low, complexity_high = complexity_range
+
+    # Chances above 1 always succeed and chances below 0 never do
+    attack_success_rate = _uniform_mean(
+        10 * difficulty, 30 * difficulty,
+        lambda strength: np.clip(strength / (defender_cybersecurity[..., None] + 1), 0, 1))
+    evidence_collection_rate = _uniform_mean(
+        np.asarray(complexity_low), np.asarray(complexity_high),
+        lambda complexity: np.clip(defender_forensics[..., None] / (complexity + 1), 0, 1))
+    return {
+        "attack_success_rate": attack_success_rate[()],
+        "evidence_collection_rate": evidence_collection_rate[()],
+    }
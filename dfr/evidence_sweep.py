@@ -0,0 +1,122 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Sensitivity sweep of run_simulation() over difficulty and defender readiness.
+
+run_simulation() hard-codes training=80, awareness=70, experience=60 and
+procedures=90. Here every combination of those inputs, the difficulty and the
+evidence complexity range is a row of one table, and the whole table is
+evaluated at once, either with exact_rates() or with a Monte Carlo pass that
+draws all grid points together.
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from dfr.evidence_batch import exact_rates, wilson_interval
+
+GRID_COLUMNS = ("difficulty", "training", "awareness", "experience", "procedures", "complexity_low", "complexity_high")
+_METHODS = ("exact", "monte_carlo")
+
+
+def sensitivity_grid(difficulty=(1, 2, 3), training=(80,), awareness=(70,), experience=(60,), procedures=(90,),
+                     complexity_range=((50, 80),)):
+    """
+    Builds the full grid of sweep points.
+
+    Args:
+        difficulty (iterable): Difficulty levels (1-low, 3-high).
+        training, awareness (iterable): Defender cybersecurity inputs (0-100).
+        experience, procedures (iterable): Defender forensics inputs (0-100).
+        complexity_range (iterable): Inclusive (low, high) evidence complexity ranges.
+
+    Returns:
+        DataFrame: One row per grid point with the GRID_COLUMNS.
+    """
+    rows = [
+        (d, t, a, e, p, low, high)
+        for d, t, a, e, p, (low, high) in itertools.product(
+            difficulty, training, awareness, experience, procedures, complexity_range)
+    ]
+    return pd.DataFrame(rows, columns=list(GRID_COLUMNS))
+
+
+def run_sensitivity(grid, method="exact", n_trials=10_000, confidence=0.95, rng=None, chunk_size=1_000_000):
+    """
+    Evaluates every grid point.
+
+    Args:
+        grid (DataFrame): Grid points from sensitivity_grid().
+        method (str): "exact" for exact_rates() or "monte_carlo" for a simulation.
+        n_trials (int): Trials per grid point (Monte Carlo only).
+        confidence (float): Confidence level of the Wilson intervals (Monte Carlo only).
+        rng: numpy Generator or seed (Monte Carlo only).
+        chunk_size (int): Trials simulated per pass (Monte Carlo only), bounding memory use.
+
+    Returns:
+        DataFrame: The grid with defender_cybersecurity, defender_forensics,
+        attack_success_rate and evidence_collection_rate columns. The Monte Carlo method
+        adds n_trials, n_attacks and the interval bounds under rate + "_low" / "_high".
+    """
+    if method not in _METHODS:
+        raise ValueError("Invalid method. Choose 'exact' or 'monte_carlo'.")
+    columns = {name: grid[name].to_numpy() for name in GRID_COLUMNS}
+    result = grid.reset_index(drop=True).copy()
+    result["defender_cybersecurity"] = np.minimum(100, columns["training"] * 0.7 + columns["awareness"] * 0.3)
+    result["defender_forensics"] = np.minimum(100, columns["experience"] * 0.8 + columns["procedures"] * 0.2)
+
+    if method == "exact":
+        rates = exact_rates(columns["difficulty"], columns["training"], columns["awareness"], columns["experience"],
+                            columns["procedures"], (columns["complexity_low"], columns["complexity_high"]))
+        result["attack_success_rate"] = rates["attack_success_rate"]
+        result["evidence_collection_rate"] = rates["evidence_collection_rate"]
+        return result
+
+    attacks, evidence = _simulate_grid(columns, result["defender_cybersecurity"].to_numpy(),
+                                       result["defender_forensics"].to_numpy(), n_trials,
+                                       np.random.default_rng(rng), chunk_size)
+    result["n_trials"] = n_trials
+    result["n_attacks"] = attacks
+    result["attack_success_rate"] = attacks / n_trials
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result["evidence_collection_rate"] = np.where(attacks > 0, evidence / attacks, np.nan)
+    result["attack_success_rate_low"], result["attack_success_rate_high"] = wilson_interval(
+        attacks, n_trials, confidence)
+    result["evidence_collection_rate_low"], result["evidence_collection_rate_high"] = wilson_interval(
+        evidence, attacks, confidence)
+    return result
+
+
+def _simulate_grid(columns, defender_cybersecurity, defender_forensics, n_trials, rng, chunk_size):
+    """
+    Counts successful attacks and collected evidence per grid point, drawing a
+    (grid points, trials) block per pass like simulate_trials() does for one point.
+    """
+    n_points = len(defender_cybersecurity)
+    attacks = np.zeros(n_points, dtype=np.int64)
+    evidence = np.zeros(n_points, dtype=np.int64)
+    trials_per_pass = max(1, min(n_trials, chunk_size // max(n_points, 1)))
+    difficulty = columns["difficulty"][:, None]
+    for start in range(0, n_trials, trials_per_pass):
+        shape = (n_points, min(trials_per_pass, n_trials - start))
+        attacker_strength = rng.integers(10 * difficulty, 30 * difficulty, shape, endpoint=True)
+        attack_successful = rng.random(shape) < attacker_strength / (defender_cybersecurity[:, None] + 1)
+        evidence_complexity = rng.integers(columns["complexity_low"][:, None], columns["complexity_high"][:, None],
+                                           shape, endpoint=True)
+        collected = rng.random(shape) < defender_forensics[:, None] / (evidence_complexity + 1)
+        attacks += np.count_nonzero(attack_successful, axis=1)
+        evidence += np.count_nonzero(attack_successful & collected, axis=1)
+    return attacks, evidence
+
+
+def main():
+    # Readiness planning grid around the sample values of run_simulation()
+    grid = sensitivity_grid(difficulty=(1, 2, 3), training=range(40, 101, 10), awareness=range(40, 101, 10),
+                            experience=range(40, 101, 10), procedures=(60, 90), complexity_range=((50, 80), (80, 120)))
+    results = run_sensitivity(grid)
+    print(results.describe().to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Vectorized evolutionary attacker/defender game (evolutionary-game-DFR.py).
+
+The fuzzy strategy functions work on whole populations, the payoffs of all
+attacker/defender pairs are computed with array operations instead of a nested
+Python loop, and selection and mutation draw whole generations at once from a
+single numpy Generator.
+
+Populations may carry leading axes: an (R, n) array holds R independent
+replicate populations, and every function below works on the last axis only,
+which is how run_ensemble() evolves many replicates in one pass.
+"""
+import numpy as np
+
+
+def attacker_strategy(resources):
+    """
+    Fuzzy attack strength for an array (or scalar) of attacker resources.
+    """
+    resources = np.asarray(resources, dtype=np.float64)
+    return np.where(resources < 3, 1.0, np.where(resources <= 6, (resources - 3) / 3, 0.0))
+
+
+def defender_strategy(resources):
+    """
+    Fuzzy defense strength for an array (or scalar) of defender resources.
+    """
+    resources = np.asarray(resources, dtype=np.float64)
+    return np.where(resources < 3, 0.0, np.where(resources <= 6, (resources - 3) / 3, 1.0))
+
+
+def payoff_matrix(attacker_population, defender_population, defender_readiness, n_resources):
+    """
+    Resources gained by each attacker and lost by each defender, for every pair.
+
+    Args:
+        attacker_population (ndarray): Attacker strategies.
+        defender_population (ndarray): Defender strategies.
+        defender_readiness (ndarray): Readiness of each defender.
+        n_resources (float): Total number of resources.
+
+    Returns:
+        tuple: (resources_gained, resources_lost), both (..., n_attackers, n_defenders) arrays.
+    """
+    share = n_resources / (np.shape(attacker_population)[-1] + np.shape(defender_population)[-1])
+    attack_strength = attacker_strategy(attacker_population)[..., :, None]
+    defense_strength = (defender_strategy(defender_population) * defender_readiness)[..., None, :]
+    resources_gained = attack_strength * (1 - defense_strength) * share
+    resources_lost = defense_strength * attack_strength * share
+    return resources_gained, resources_lost
+
+
+def payoffs(attacker_population, defender_population, defender_readiness, n_resources):
+    """
+    Total payoff of every attacker and defender over all pairings.
+
+    Every pair's payoff is a product of an attacker term and a defender term, so the
+    sums over opponents factor out and no (n_attackers, n_defenders) matrix is built.
+    Use payoff_matrix() to inspect individual pairs.
+
+    Args:
+        attacker_population (ndarray): Attacker strategies.
+        defender_population (ndarray): Defender strategies.
+        defender_readiness (ndarray): Readiness of each defender.
+        n_resources (float): Total number of resources.
+
+    Returns:
+        tuple: (attacker_payoffs, defender_payoffs, defense_strength_used)
+    """
+    n_attackers = np.shape(attacker_population)[-1]
+    share = n_resources / (n_attackers + np.shape(defender_population)[-1])
+    attack_strength = attacker_strategy(attacker_population)
+    defense_strength = defender_strategy(defender_population) * defender_readiness
+    attacker_payoffs = attack_strength * np.sum(1 - defense_strength, axis=-1, keepdims=True) * share
+    defender_payoffs = n_attackers * share - defense_strength * np.sum(attack_strength, axis=-1, keepdims=True) * share
+    return attacker_payoffs, defender_payoffs, defense_strength
+
+
+def tournament_contestants(n, tournament_size, rng, size=()):
+    """
+    Draws tournament_size distinct contestants for each of n tournaments.
+
+    Equivalent to random.sample(range(n), tournament_size) per tournament: the j-th
+    pick is a uniform rank among the n - j individuals not yet picked, mapped to an
+    index by stepping over the earlier picks in ascending order.
+
+    Args:
+        n (int): Population size (and number of tournaments).
+        tournament_size (int): Contestants per tournament.
+        rng (Generator): Random number generator.
+        size (tuple): Leading replicate axes.
+
+    Returns:
+        ndarray: size + (n, tournament_size) contestant indices in draw order.
+    """
+    if not 1 <= tournament_size <= n:
+        raise ValueError("Tournament size must be between 1 and the population size.")
+    contestants = np.empty(tuple(size) + (n, tournament_size), dtype=np.intp)
+    for j in range(tournament_size):
+        pick = rng.integers(0, n - j, tuple(size) + (n,))
+        earlier = np.sort(contestants[..., :j], axis=-1)
+        for k in range(j):
+            pick += pick >= earlier[..., k]
+        contestants[..., j] = pick
+    return contestants
+
+
+def tournament_select(population, payoffs, rng, tournament_size=2):
+    """
+    Tournament selection: each slot of the new population is filled by the best of
+    tournament_size distinct random individuals (ties go to the first one drawn).
+    """
+    *size, n = population.shape
+    contestants = tournament_contestants(n, tournament_size, rng, size)
+    flat = contestants.reshape(*size, n * tournament_size)
+    contestant_payoffs = np.take_along_axis(payoffs, flat, axis=-1).reshape(contestants.shape)
+    winner = np.argmax(contestant_payoffs, axis=-1)[..., None]
+    selected = np.take_along_axis(contestants, winner, axis=-1)[..., 0]
+    return np.take_along_axis(population, selected, axis=-1)
+
+
+def mutate(population, rng, mutation="uniform", mutation_scale=0.01):
+    """
+    Adds a random mutation to every individual and clips strategies to [0, 1].
+
+    Args:
+        population (ndarray): Strategies to mutate.
+        rng (Generator): Random number generator.
+        mutation (str or callable): "uniform" adds U(0, mutation_scale) as in
+            evolutionary-game-DFR.py, "normal" adds N(0, mutation_scale). A callable
+            is called as mutation(rng, size) and returns the steps.
+        mutation_scale (float): Scale of the built-in distributions.
+
+    Returns:
+        ndarray: Mutated population.
+    """
+    if callable(mutation):
+        step = mutation(rng, population.shape)
+    elif mutation == "uniform":
+        step = rng.random(population.shape) * mutation_scale
+    elif mutation == "normal":
+        step = rng.normal(0, mutation_scale, population.shape)
+    else:
+        raise ValueError("Invalid mutation. Choose 'uniform', 'normal' or a callable.")
+    return np.clip(population + step, 0, 1)
+
+
+def has_converged(trajectories, window=10, tolerance=1e-3):
+    """
+    Equilibrium check on the tracked population means.
+
+    A trajectory has converged once, over the last window generations, neither any
+    generation-to-generation change nor the net change across the window exceeds
+    tolerance, so a slow steady trend is not taken for flat; all trajectories have
+    to agree.
+
+    Args:
+        trajectories (list): Per-generation arrays (generations first), e.g. the
+            avg_attacker_strategy and avg_defender_strategy histories.
+        window (int): Number of recent generation steps inspected.
+        tolerance (float): Largest change, per generation and across the window,
+            still counted as flat.
+
+    Returns:
+        bool or ndarray: Convergence (per replicate when the trajectories have a replicate axis).
+    """
+    converged = True
+    for trajectory in trajectories:
+        recent = np.asarray(trajectory[-window - 1:])
+        if len(trajectory) <= window:
+            return np.zeros(recent.shape[1:], dtype=bool) if recent.ndim > 1 else False
+        change = np.abs(np.diff(recent, axis=0)).max(axis=0)
+        trend = np.abs(recent[-1] - recent[0])
+        converged = converged & (change <= tolerance) & (trend <= tolerance)
+    return converged
+
+
+def _evolve(size, n_attackers, n_defenders, n_resources, n_generations, rng, tournament_size, mutation,
+            mutation_scale, tolerance, window):
+    """
+    Evolves populations with leading axes size and tracks the per-generation
+    population means, shaped (generations run,) + size. With a tolerance the run
+    stops as soon as the strategy means of every replicate have converged (see
+    has_converged()). Readiness grows by a fixed amount every generation, so it
+    never settles and is left out of the check.
+    """
+    attacker_population = rng.random(tuple(size) + (n_attackers,))
+    defender_population = rng.random(tuple(size) + (n_defenders,))
+    defender_readiness = np.zeros(tuple(size) + (n_defenders,))
+
+    avg_attacker_strategy = np.empty((n_generations,) + tuple(size))
+    avg_defender_strategy = np.empty((n_generations,) + tuple(size))
+    avg_defender_readiness = np.empty((n_generations,) + tuple(size))
+    converged_generation = np.full(tuple(size), -1)
+    generations_run = n_generations
+    for generation in range(n_generations):
+        # Defender Readiness Phase (defense strength is only known after the payoffs)
+        defender_readiness += defender_strategy(n_resources) * 0.001
+
+        attacker_payoffs, defender_payoffs, defense_strength_used = payoffs(
+            attacker_population, defender_population, defender_readiness, n_resources)
+
+        # Selection (tournament selection) and mutation
+        attacker_population = mutate(tournament_select(attacker_population, attacker_payoffs, rng, tournament_size),
+                                     rng, mutation, mutation_scale)
+        defender_population = mutate(tournament_select(defender_population, defender_payoffs, rng, tournament_size),
+                                     rng, mutation, mutation_scale)
+
+        avg_attacker_strategy[generation] = np.mean(attacker_population, axis=-1)
+        avg_defender_strategy[generation] = np.mean(defender_population, axis=-1)
+        avg_defender_readiness[generation] = np.mean(defender_readiness, axis=-1)
+
+        if tolerance is not None:
+            history = [trajectory[:generation + 1] for trajectory in (avg_attacker_strategy, avg_defender_strategy)]
+            converged = has_converged(history, window, tolerance)
+            converged_generation = np.where(converged & (converged_generation < 0), generation, converged_generation)
+            if np.all(converged_generation >= 0):
+                generations_run = generation + 1
+                break
+
+    return {
+        "avg_attacker_strategy": avg_attacker_strategy[:generations_run],
+        "avg_defender_strategy": avg_defender_strategy[:generations_run],
+        "avg_defender_readiness": avg_defender_readiness[:generations_run],
+        "converged_generation": converged_generation if size else int(converged_generation),
+        "generations_run": generations_run,
+        "attacker_population": attacker_population,
+        "defender_population": defender_population,
+        "defender_readiness": defender_readiness,
+    }
+
+
+def run_game(n_attackers=5, n_defenders=10, n_resources=5, n_generations=100, rng=None,
+             tournament_size=2, mutation="uniform", mutation_scale=0.01, tolerance=None, window=10):
+    """
+    Runs the evolutionary game of evolutionary-game-DFR.py.
+
+    Args:
+        n_attackers (int): Attacker population size.
+        n_defenders (int): Defender population size.
+        n_resources (float): Total number of resources.
+        n_generations (int): Number of generations.
+        rng: numpy Generator or seed used for every random draw.
+        tournament_size (int): Contestants per selection tournament.
+        mutation (str or callable): Mutation distribution, see mutate().
+        mutation_scale (float): Scale of the mutation distribution.
+        tolerance (float): Stop early once the mean attacker and defender strategies
+            have converged (see has_converged()); None always runs n_generations.
+        window (int): Generation steps inspected by the convergence check.
+
+    Returns:
+        dict: Per-generation avg_attacker_strategy, avg_defender_strategy and
+        avg_defender_readiness, the generation of convergence (-1 if none),
+        the number of generations run and the final populations.
+    """
+    return _evolve((), n_attackers, n_defenders, n_resources, n_generations, np.random.default_rng(rng),
+                   tournament_size, mutation, mutation_scale, tolerance, window)
+
+
+def run_ensemble(n_replicates, n_attackers=5, n_defenders=10, n_resources=5, n_generations=100, rng=None,
+                 tournament_size=2, mutation="uniform", mutation_scale=0.01, tolerance=None, window=10,
+                 quantiles=(0.05, 0.5, 0.95)):
+    """
+    Evolves n_replicates independent games together, stacked along a replicate axis.
+
+    Args:
+        n_replicates (int): Number of independent replicate games.
+        quantiles (tuple): Quantiles of the replicate trajectories to report.
+        Other arguments as in run_game().
+
+    Returns:
+        dict: For each of avg_attacker_strategy, avg_defender_strategy and
+        avg_defender_readiness: the (n_generations, n_replicates) trajectories under
+        its own name, the mean over replicates under name + "_mean" and the
+        (n_generations, len(quantiles)) quantiles under name + "_quantiles". With a
+        tolerance the run stops once every replicate has converged; converged_generation
+        holds each replicate's generation of convergence (-1 if none).
+    """
+    result = _evolve((n_replicates,), n_attackers, n_defenders, n_resources, n_generations,
+                     np.random.default_rng(rng), tournament_size, mutation, mutation_scale, tolerance, window)
+    summary = {
+        "quantiles": np.asarray(quantiles),
+        "converged_generation": result["converged_generation"],
+        "generations_run": result["generations_run"],
+    }
+    for name in ("avg_attacker_strategy", "avg_defender_strategy", "avg_defender_readiness"):
+        trajectories = result[name]
+        summary[name] = trajectories
+        summary[name + "_mean"] = trajectories.mean(axis=1)
+        summary[name + "_quantiles"] = np.quantile(trajectories, quantiles, axis=1).T
+    return summary
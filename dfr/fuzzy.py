@@ -0,0 +1,302 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Fuzzy inference engine for the DFR models.
+
+Linguistic variables hold named triangular (3 parameters) or trapezoidal
+(4 parameters) sets. A RuleBase of Mamdani or Sugeno rules over those variables
+is compiled once into index and parameter arrays, and the compiled rule base
+then evaluates whole batches of inputs with array operations:
+
+    training = LinguisticVariable("training", (0, 100), {"low": (0, 20, 50), "high": (70, 100, 100)})
+    ...
+    rules = RuleBase([training, experience], readiness, [
+        Rule({"training": "high", "experience": "high"}, "high"),
+        Rule({"training": "low"}, "low"),
+    ])
+    engine = rules.compile()
+    engine(training=training_levels, experience=experience_levels)
+"""
+import numpy as np
+
+_METHODS = ("mamdani", "sugeno")
+_AND_METHODS = ("min", "prod")
+_IMPLICATIONS = ("min", "prod")
+_DEFUZZIFICATIONS = ("centroid", "bisector", "mom")
+
+
+def _trapezoid_params(params):
+    # Triangles (a, b, c) are trapezoids (a, b, b, c)
+    if len(params) == 3:
+        return (params[0], params[1], params[1], params[2])
+    if len(params) == 4:
+        return tuple(params)
+    raise ValueError("Invalid fuzzy set. Use 3 (triangular) or 4 (trapezoidal) parameters.")
+
+
+def trapezoidal(x, a, b, c, d):
+    """
+    Trapezoidal membership: rises from a to b, is 1 from b to c and falls from c to d.
+
+    A zero-width edge (a == b or c == d) is a vertical edge, so (0, 0, 0, 3) is a
+    left shoulder starting at 0 and (70, 100, 100, 100) a right shoulder ending at 100.
+    Every argument may be an array; they are broadcast against each other.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    a, b, c, d = (np.asarray(p, dtype=np.float64) for p in (a, b, c, d))
+    rising = np.where(b > a, (x - a) / np.where(b > a, b - a, 1), x >= a)
+    falling = np.where(d > c, (d - x) / np.where(d > c, d - c, 1), x <= d)
+    return np.clip(np.minimum(rising, falling), 0, 1)
+
+
+def triangular(x, a, b, c):
+    """
+    Triangular membership with feet a and c and peak b (see trapezoidal()).
+    """
+    return trapezoidal(x, a, b, b, c)
+
+
+class LinguisticVariable:
+    """
+    A named variable with fuzzy sets (terms).
+
+    Args:
+        name (str): Variable name, used as keyword when evaluating a rule base.
+        universe (tuple): (low, high) range of the variable.
+        terms (dict): Term name -> 3 (triangular) or 4 (trapezoidal) set parameters.
+    """
+
+    def __init__(self, name, universe, terms):
+        self.name = name
+        self.universe = tuple(universe)
+        self.terms = dict(terms)
+        self.term_names = tuple(self.terms)
+        self.params = np.array([_trapezoid_params(params) for params in self.terms.values()], dtype=np.float64)
+
+    def term_index(self, term):
+        try:
+            return self.term_names.index(term)
+        except ValueError:
+            raise ValueError(f"Invalid term '{term}' for variable '{self.name}'.") from None
+
+    def membership(self, values):
+        """
+        Membership of values in every term.
+
+        Returns:
+            ndarray: (n_terms,) + values.shape membership degrees.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        params = self.params.reshape(self.params.shape + (1,) * values.ndim)
+        return trapezoidal(values, params[:, 0], params[:, 1], params[:, 2], params[:, 3])
+
+
+class Rule:
+    """
+    A fuzzy rule "if antecedent then consequent".
+
+    Args:
+        antecedent (dict): Input variable name -> term; variables left out do not matter.
+        consequent: Output term (Mamdani), or the Sugeno output: a constant or a dict of
+            "const" and per-input coefficients of a first-order (linear) output.
+        operator (str): "and" or "or" to combine the antecedent clauses.
+        weight (float): Rule weight between 0 and 1.
+    """
+
+    def __init__(self, antecedent, consequent, operator="and", weight=1.0):
+        if operator not in ("and", "or"):
+            raise ValueError("Invalid operator. Choose 'and' or 'or'.")
+        self.antecedent = dict(antecedent)
+        self.consequent = consequent
+        self.operator = operator
+        self.weight = weight
+
+
+class RuleBase:
+    """
+    Rules over input variables and one output variable.
+
+    Args:
+        inputs (list): Input LinguisticVariables.
+        output: Output LinguisticVariable (Mamdani) or output name (Sugeno).
+        rules (list): Rules.
+        method (str): "mamdani" or "sugeno".
+        and_method (str): "min" or "prod" for the "and" operator ("or" is always max).
+        implication (str): "min" (clipping) or "prod" (scaling) of the Mamdani output sets.
+        defuzzification (str): "centroid", "bisector" or "mom" (mean of maximum), Mamdani only.
+        resolution (int): Points of the output universe grid, Mamdani only.
+    """
+
+    def __init__(self, inputs, output, rules, method="mamdani", and_method="min", implication="min",
+                 defuzzification="centroid", resolution=201):
+        if method not in _METHODS:
+            raise ValueError("Invalid method. Choose 'mamdani' or 'sugeno'.")
+        if and_method not in _AND_METHODS:
+            raise ValueError("Invalid and_method. Choose 'min' or 'prod'.")
+        if implication not in _IMPLICATIONS:
+            raise ValueError("Invalid implication. Choose 'min' or 'prod'.")
+        if defuzzification not in _DEFUZZIFICATIONS:
+            raise ValueError("Invalid defuzzification. Choose 'centroid', 'bisector' or 'mom'.")
+        self.inputs = list(inputs)
+        self.output = output
+        self.rules = list(rules)
+        self.method = method
+        self.and_method = and_method
+        self.implication = implication
+        self.defuzzification = defuzzification
+        self.resolution = resolution
+
+    def compile(self):
+        """
+        Packs the rule base into arrays.
+
+        Returns:
+            CompiledRuleBase: Callable evaluating batches of inputs.
+        """
+        return CompiledRuleBase(self)
+
+
+class CompiledRuleBase:
+    """
+    Array form of a RuleBase; call it with one array (or scalar) per input variable.
+
+    Every input's terms sit in a padded membership table with two extra slots, one
+    always 1 and one always 0, that stand in for variables a rule does not mention
+    ("and" and "or" rules respectively). The firing strength of all rules is then one
+    gather from that table followed by a min/prod or max over the inputs.
+    """
+
+    def __init__(self, rule_base):
+        self.method = rule_base.method
+        self.and_method = rule_base.and_method
+        self.implication = rule_base.implication
+        self.defuzzification = rule_base.defuzzification
+        self.input_names = tuple(variable.name for variable in rule_base.inputs)
+        self._inputs = rule_base.inputs
+        n_inputs = len(self._inputs)
+        n_rules = len(rule_base.rules)
+        max_terms = max(len(variable.term_names) for variable in self._inputs)
+        self._one_slot = max_terms
+        self._zero_slot = max_terms + 1
+        self._n_slots = max_terms + 2
+
+        self.antecedents = np.empty((n_rules, n_inputs), dtype=np.intp)
+        self.is_or = np.zeros(n_rules, dtype=bool)
+        self.weights = np.empty(n_rules)
+        for r, rule in enumerate(rule_base.rules):
+            unknown = set(rule.antecedent) - set(self.input_names)
+            if unknown:
+                raise ValueError(f"Invalid rule. Unknown input variables: {sorted(unknown)}.")
+            self.is_or[r] = rule.operator == "or"
+            self.weights[r] = rule.weight
+            for i, variable in enumerate(self._inputs):
+                if variable.name in rule.antecedent:
+                    self.antecedents[r, i] = variable.term_index(rule.antecedent[variable.name])
+                else:
+                    self.antecedents[r, i] = self._zero_slot if self.is_or[r] else self._one_slot
+
+        if self.method == "mamdani":
+            output = rule_base.output
+            self.output_grid = np.linspace(output.universe[0], output.universe[1], rule_base.resolution)
+            self.output_membership = output.membership(self.output_grid)
+            consequents = np.array([output.term_index(rule.consequent) for rule in rule_base.rules], dtype=np.intp)
+            # Rules sharing an output term merge before implication: max_r min(f_r, g) == min(max_r f_r, g)
+            self._term_rules = [np.flatnonzero(consequents == k) for k in range(len(output.term_names))]
+        else:
+            self.coefficients = np.zeros((n_rules, n_inputs + 1))
+            for r, rule in enumerate(rule_base.rules):
+                if isinstance(rule.consequent, dict):
+                    unknown = set(rule.consequent) - set(self.input_names) - {"const"}
+                    if unknown:
+                        raise ValueError(f"Invalid rule. Unknown input variables: {sorted(unknown)}.")
+                    self.coefficients[r, 0] = rule.consequent.get("const", 0.0)
+                    for i, name in enumerate(self.input_names):
+                        self.coefficients[r, i + 1] = rule.consequent.get(name, 0.0)
+                else:
+                    self.coefficients[r, 0] = rule.consequent
+
+    def _values(self, inputs):
+        missing = set(self.input_names) - set(inputs)
+        if missing:
+            raise ValueError(f"Missing input variables: {sorted(missing)}.")
+        values = np.broadcast_arrays(*(np.asarray(inputs[name], dtype=np.float64) for name in self.input_names))
+        return np.stack([value.ravel() for value in values]), values[0].shape
+
+    def firing_strengths(self, **inputs):
+        """
+        Firing strength of every rule.
+
+        Returns:
+            ndarray: (n_rules,) + input shape firing strengths, rule weights applied.
+        """
+        values, shape = self._values(inputs)
+        return self._firing_strengths(values).reshape((len(self.weights),) + shape)
+
+    def _firing_strengths(self, values):
+        n_inputs, n = values.shape
+        table = np.empty((n_inputs, self._n_slots, n))
+        for i, variable in enumerate(self._inputs):
+            table[i, :len(variable.term_names)] = variable.membership(values[i])
+        table[:, self._one_slot] = 1.0
+        table[:, self._zero_slot] = 0.0
+        degrees = table[np.arange(n_inputs), self.antecedents]  # (n_rules, n_inputs, n)
+
+        if self.and_method == "min":
+            strengths = degrees.min(axis=1)
+        else:
+            strengths = degrees.prod(axis=1)
+        if self.is_or.any():
+            strengths[self.is_or] = degrees[self.is_or].max(axis=1)
+        return strengths * self.weights[:, None]
+
+    def __call__(self, chunk_size=1024, **inputs):
+        """
+        Evaluates the rule base.
+
+        Args:
+            chunk_size (int): Inputs aggregated per pass (Mamdani), bounding the
+                (chunk_size, resolution) aggregation array.
+            **inputs: One array (or scalar) per input variable, broadcast together.
+
+        Returns:
+            ndarray: Crisp output per input; nan where no rule fires.
+        """
+        values, shape = self._values(inputs)
+        strengths = self._firing_strengths(values)
+        if self.method == "sugeno":
+            rule_outputs = self.coefficients[:, :1] + self.coefficients[:, 1:] @ values
+            total = strengths.sum(axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result = np.where(total > 0, (strengths * rule_outputs).sum(axis=0) / total, np.nan)
+            return result.reshape(shape)[()]
+
+        term_strengths = np.zeros((len(self._term_rules), strengths.shape[1]))
+        for k, rules in enumerate(self._term_rules):
+            if len(rules):
+                term_strengths[k] = strengths[rules].max(axis=0)
+        result = np.empty(strengths.shape[1])
+        for start in range(0, len(result), chunk_size):
+            result[start:start + chunk_size] = self._defuzzify(term_strengths[:, start:start + chunk_size])
+        return result.reshape(shape)[()]
+
+    def _defuzzify(self, term_strengths):
+        aggregated = np.zeros((term_strengths.shape[1], len(self.output_grid)))
+        implied = np.empty_like(aggregated)
+        for k in range(len(term_strengths)):
+            if self.implication == "min":
+                np.minimum(term_strengths[k][:, None], self.output_membership[k][None, :], out=implied)
+            else:
+                np.multiply(term_strengths[k][:, None], self.output_membership[k][None, :], out=implied)
+            np.maximum(aggregated, implied, out=aggregated)
+
+        total = aggregated.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if self.defuzzification == "centroid":
+                crisp = aggregated @ self.output_grid / total
+            elif self.defuzzification == "bisector":
+                cumulative = np.cumsum(aggregated, axis=1)
+                crisp = self.output_grid[np.argmax(cumulative >= total[:, None] / 2, axis=1)]
+            else:
+                peak = aggregated >= aggregated.max(axis=1, keepdims=True)
+                crisp = peak @ self.output_grid / peak.sum(axis=1)
+        return np.where(total > 0, crisp, np.nan)
@@ -0,0 +1,129 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Array-backed event log for the readiness game (readiness-training.py).
+
+Games are recorded into a preallocated structured array instead of being
+printed one by one; the log grows by doubling when it fills up. A summary
+(win rate, readiness and severity counts) can be printed once at the end.
+"""
+import numpy as np
+import pandas as pd
+
+from dfr.readiness_training import SEVERITY_LABELS
+
+GAME_DTYPE = np.dtype([
+    ("defenders_win", np.bool_),
+    ("training", np.int32),
+    ("experience", np.int32),
+    ("readiness", np.float64),
+    ("advantage", np.float64),
+    ("vulnerability", np.float64),
+    ("severity", np.int8),
+])
+
+_SEVERITY_CODES = {label: code for code, label in enumerate(SEVERITY_LABELS)}
+# cvss_to_severity() thresholds, with the severity code of each bucket in ascending score order
+SEVERITY_THRESHOLDS = np.array([0.1, 4.0, 7.0])
+SEVERITY_BUCKETS = np.array([3, 2, 1, 0], dtype=np.int8)
+
+
+def severity_codes(score):
+    """
+    Array version of cvss_to_severity() returning indices into SEVERITY_LABELS.
+    NaN scores fail every threshold there and map to Gray (Unknown), not the top bucket.
+    """
+    score = np.asarray(score, dtype=np.float64)
+    codes = SEVERITY_BUCKETS[np.searchsorted(SEVERITY_THRESHOLDS, score, side="right")]
+    return np.where(np.isnan(score), SEVERITY_BUCKETS[0], codes)
+
+
+class GameLog:
+    """
+    Preallocated log of readiness games.
+
+    Args:
+        capacity (int): Games preallocated; the log doubles its capacity when full.
+    """
+
+    def __init__(self, capacity=1024):
+        self._games = np.zeros(max(capacity, 1), dtype=GAME_DTYPE)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def games(self):
+        """
+        Structured array (GAME_DTYPE) of the recorded games.
+        """
+        return self._games[:self._size]
+
+    def _reserve(self, n):
+        if self._size + n > len(self._games):
+            games = np.zeros(max(2 * len(self._games), self._size + n), dtype=GAME_DTYPE)
+            games[:self._size] = self._games[:self._size]
+            self._games = games
+
+    def append(self, defenders_win, training, experience, readiness, advantage, vulnerability, severity):
+        """
+        Records a single game; severity is a cvss_to_severity() label or code.
+        """
+        self._reserve(1)
+        self._games[self._size] = (defenders_win, training, experience, readiness, advantage, vulnerability,
+                                   _SEVERITY_CODES.get(severity, severity))
+        self._size += 1
+
+    def extend(self, defenders_win, training, experience, readiness, advantage, vulnerability, severity=None):
+        """
+        Records a batch of games from arrays; severity codes are derived from the
+        vulnerability when not given.
+        """
+        n = len(readiness)
+        self._reserve(n)
+        games = self._games[self._size:self._size + n]
+        games["defenders_win"] = defenders_win
+        games["training"] = training
+        games["experience"] = experience
+        games["readiness"] = readiness
+        games["advantage"] = advantage
+        games["vulnerability"] = vulnerability
+        games["severity"] = severity_codes(vulnerability) if severity is None else severity
+        self._size += n
+
+    def summary(self):
+        """
+        Summarizes the recorded games.
+
+        Returns:
+            dict: n_games, defender_win_rate, mean_readiness, mean_advantage and the number
+            of games per severity label.
+        """
+        games = self.games
+        counts = np.bincount(games["severity"], minlength=len(SEVERITY_LABELS))
+        return {
+            "n_games": self._size,
+            "defender_win_rate": float(games["defenders_win"].mean()) if self._size else float("nan"),
+            "mean_readiness": float(games["readiness"].mean()) if self._size else float("nan"),
+            "mean_advantage": float(games["advantage"].mean()) if self._size else float("nan"),
+            "severity_counts": dict(zip(SEVERITY_LABELS, counts.tolist())),
+        }
+
+    def print_summary(self):
+        """
+        Prints summary() in the wording of the per-game messages.
+        """
+        summary = self.summary()
+        print(f"Games: {summary['n_games']}, Defenders win: {summary['defender_win_rate']:.2%}")
+        print(f"Mean Readiness: {summary['mean_readiness']:.2f}, Mean Advantage: {summary['mean_advantage']:.2f}")
+        for label, count in summary["severity_counts"].items():
+            print(f"Vulnerability {label}: {count}")
+
+    def to_frame(self):
+        """
+        The recorded games as a DataFrame with severity labels.
+        """
+        frame = pd.DataFrame(self.games)
+        frame["severity"] = pd.Categorical.from_codes(frame["severity"], categories=list(SEVERITY_LABELS))
+        return frame
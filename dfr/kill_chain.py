@@ -0,0 +1,188 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Vectorized kill-chain campaigns over the attacker tactics (attacker-tactics.py).
+
+STAGES restates every tactic function as data: its posture and resource
+weights, the breakpoints of its resource score and the weighted terms fed by
+earlier stages. A stage is only attempted once the stages it requires have
+succeeded (the prerequisites named in the tactic docstrings), so run_campaigns()
+yields a conversion funnel across the chain. All campaigns advance one stage at
+a time as arrays, with one Generator for every draw.
+"""
+import numpy as np
+import pandas as pd
+
+from dfr.attacker_tactics import get_fuzzy_score
+from dfr.recon_state import ALL_SYSTEMS, FULL_RECON
+
+# One entry per tactic function, in chain order. terms are (weight, feature) pairs
+# or (weight, "motivation", breakpoints); see _feature() for the features.
+STAGES = (
+    {"name": "perform_reconnaissance", "posture_weight": 0.4, "resource_weight": 0.3,
+     "resource_breakpoints": (0, 50, 80, 100), "terms": ((0.3, "motivation", (0, 20, 70, 100)),), "requires": ()},
+    {"name": "develop_resources", "posture_weight": 0.0, "resource_weight": 0.7,
+     "resource_breakpoints": (0, 20, 50, 80, 100), "terms": ((0.3, "motivation", (0, 40, 70, 100)),), "requires": ()},
+    {"name": "gain_initial_access", "posture_weight": 0.4, "resource_weight": 0.3,
+     "resource_breakpoints": (0, 50, 80, 100), "terms": ((0.3, "recon_vulnerabilities"),), "requires": ()},
+    {"name": "execute_malware", "posture_weight": 0.5, "resource_weight": 0.3,
+     "resource_breakpoints": (0, 20, 50, 80, 100), "terms": ((0.2, "access_point"),),
+     "requires": ("gain_initial_access",)},
+    {"name": "establish_persistence", "posture_weight": 0.5, "resource_weight": 0.3,
+     "resource_breakpoints": (0, 30, 60, 90, 100), "terms": ((0.2, "execute_malware"),),
+     "requires": ("execute_malware",)},
+    {"name": "escalate_privileges", "posture_weight": 0.5, "resource_weight": 0.3,
+     "resource_breakpoints": (0, 40, 70, 100), "terms": ((0.2, "establish_persistence"),),
+     "requires": ("establish_persistence",)},
+    {"name": "evade_defenses", "posture_weight": 0.6, "resource_weight": 0.2,
+     "resource_breakpoints": (0, 20, 50, 80, 100), "terms": ((0.2, "establish_persistence"),),
+     "requires": ("establish_persistence",)},
+    {"name": "steal_credentials", "posture_weight": 0.5, "resource_weight": 0.3,
+     "resource_breakpoints": (0, 30, 60, 90, 100),
+     "terms": ((0.1, "establish_persistence"), (0.1, "escalate_privileges")), "requires": ("establish_persistence",)},
+    {"name": "enumerate_systems", "posture_weight": 0.6, "resource_weight": 0.2,
+     "resource_breakpoints": (0, 20, 50, 80, 100),
+     "terms": ((0.1, "establish_persistence"), (0.1, "escalate_privileges")), "requires": ("establish_persistence",)},
+    {"name": "move_laterally", "posture_weight": 0.6, "resource_weight": 0.2,
+     "resource_breakpoints": (0, 10, 40, 70, 100),
+     "terms": ((0.1, "establish_persistence"), (0.1, "escalate_privileges"), (0.1, "discovered_systems")),
+     "requires": ("establish_persistence", "enumerate_systems")},
+    {"name": "collect_data", "posture_weight": 0.6, "resource_weight": 0.2,
+     "resource_breakpoints": (0, 20, 50, 80, 100),
+     "terms": ((0.1, "establish_persistence"), (0.1, "escalate_privileges")), "requires": ("establish_persistence",)},
+    {"name": "establish_command_and_control", "posture_weight": 0.6, "resource_weight": 0.2,
+     "resource_breakpoints": (0, 30, 60, 90, 100), "terms": ((0.2, "establish_persistence"),),
+     "requires": ("establish_persistence",)},
+    # data_weight is 0 in exfiltrate_data(), so the collected data only gates the stage
+    {"name": "exfiltrate_data", "posture_weight": 0.6, "resource_weight": 0.3,
+     "resource_breakpoints": (0, 20, 50, 80, 100), "terms": ((0.1, "establish_persistence"),),
+     "requires": ("establish_persistence", "collect_data")},
+    {"name": "deliver_impact", "posture_weight": 0.6, "resource_weight": 0.2,
+     "resource_breakpoints": (0, 40, 70, 90, 100),
+     "terms": ((0.1, "establish_persistence"), (0.1, "collected_data")), "requires": ("establish_persistence",)},
+)
+STAGE_NAMES = tuple(stage["name"] for stage in STAGES)
+
+# Resource increase range of a successful develop_resources()
+RESOURCE_INCREASE = (5, 15)
+# Values returned by the tactic functions on success that later stages count
+RECON_VULNERABILITIES = FULL_RECON.vulnerability_count  # CVEs found by perform_reconnaissance()
+DISCOVERED_SYSTEMS = len(ALL_SYSTEMS)  # Systems found by enumerate_systems()
+
+
+def _feature(name, outcomes, motivation, breakpoints=None):
+    """
+    Value of a stage term for every campaign.
+    """
+    if name == "motivation":
+        return get_fuzzy_score(motivation, breakpoints)
+    if name == "recon_vulnerabilities":
+        return RECON_VULNERABILITIES * outcomes["perform_reconnaissance"]
+    if name == "access_point":
+        # execute_malware() only raises this to 0.8 for a "vulnerable_system" access point,
+        # which no earlier tactic produces, so every campaign gets the default 0.5
+        return np.full(np.shape(motivation), 0.5)
+    if name == "discovered_systems":
+        return DISCOVERED_SYSTEMS * outcomes["enumerate_systems"]
+    if name == "collected_data":
+        return 0.5 * outcomes["collect_data"]
+    return outcomes[name].astype(np.float64)
+
+
+def stage_chance(stage, defender_posture, attacker_resources, outcomes, attacker_motivation):
+    """
+    Success chance of one stage, the weighted sum of its tactic function.
+
+    Args:
+        stage (dict): Entry of STAGES.
+        defender_posture (ndarray): Defender posture (0-1).
+        attacker_resources (ndarray): Attacker resources (0-100).
+        outcomes (dict): Stage name -> boolean outcome array of the earlier stages.
+        attacker_motivation (ndarray): Attacker motivation (0-100).
+
+    Returns:
+        ndarray: Success chance (not clipped; random() < chance treats it as a probability).
+    """
+    chance = stage["posture_weight"] * (1 - defender_posture)
+    chance = chance + stage["resource_weight"] * get_fuzzy_score(attacker_resources, stage["resource_breakpoints"])
+    for term in stage["terms"]:
+        chance = chance + term[0] * _feature(term[1], outcomes, attacker_motivation, *term[2:])
+    return chance
+
+
+def run_campaigns(n_campaigns, defender_posture, attacker_resources, attacker_motivation, rng=None,
+                  chunk_size=1_000_000):
+    """
+    Runs n_campaigns independent campaigns through the whole kill chain.
+
+    Args:
+        n_campaigns (int): Number of campaigns.
+        defender_posture (float or ndarray): Defender posture (0-1), per campaign or shared.
+        attacker_resources (float or ndarray): Attacker resources (0-100).
+        attacker_motivation (float or ndarray): Attacker motivation (0-100).
+        rng: numpy Generator or seed for every random draw.
+        chunk_size (int): Campaigns advanced together, bounding memory use.
+
+    Returns:
+        dict: "outcomes", an (n_campaigns, len(STAGES)) boolean array of stage successes
+        in STAGE_NAMES order (False for stages never attempted), and "attempted" of the
+        same shape, plus "attacker_resources" after develop_resources().
+    """
+    rng = np.random.default_rng(rng)
+    posture = np.broadcast_to(np.asarray(defender_posture, dtype=np.float64), (n_campaigns,))
+    resources = np.broadcast_to(np.asarray(attacker_resources, dtype=np.float64), (n_campaigns,))
+    motivation = np.broadcast_to(np.asarray(attacker_motivation, dtype=np.float64), (n_campaigns,))
+    outcomes = np.zeros((n_campaigns, len(STAGES)), dtype=bool)
+    attempted = np.zeros((n_campaigns, len(STAGES)), dtype=bool)
+    final_resources = np.empty(n_campaigns)
+
+    for start in range(0, n_campaigns, chunk_size):
+        chunk = slice(start, min(start + chunk_size, n_campaigns))
+        chunk_resources = resources[chunk].copy()
+        n = len(chunk_resources)
+        stage_outcomes = {}
+        for s, stage in enumerate(STAGES):
+            active = np.ones(n, dtype=bool)
+            for required in stage["requires"]:
+                active &= stage_outcomes[required]
+            chance = stage_chance(stage, posture[chunk], chunk_resources, stage_outcomes, motivation[chunk])
+            success = active & (rng.random(n) < chance)
+            if stage["name"] == "develop_resources":
+                chunk_resources += np.where(success, rng.integers(*RESOURCE_INCREASE, n, endpoint=True), 0)
+            stage_outcomes[stage["name"]] = success
+            attempted[chunk, s] = active
+            outcomes[chunk, s] = success
+        final_resources[chunk] = chunk_resources
+
+    return {"outcomes": outcomes, "attempted": attempted, "attacker_resources": final_resources}
+
+
+def funnel(result):
+    """
+    Per-stage conversion funnel of run_campaigns().
+
+    Returns:
+        DataFrame: One row per stage with the campaigns that attempted and succeeded, the
+        conversion (succeeded / attempted) and the reach (succeeded / all campaigns).
+    """
+    attempted = result["attempted"].sum(axis=0)
+    succeeded = result["outcomes"].sum(axis=0)
+    n_campaigns = len(result["outcomes"])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        conversion = np.where(attempted > 0, succeeded / attempted, np.nan)
+    return pd.DataFrame({
+        "stage": STAGE_NAMES,
+        "attempted": attempted,
+        "succeeded": succeeded,
+        "conversion": conversion,
+        "reach": succeeded / n_campaigns,
+    })
+
+
+def main():
+    result = run_campaigns(1_000_000, defender_posture=0.6, attacker_resources=60, attacker_motivation=70, rng=0)
+    print(funnel(result).to_string())
+
+
+if __name__ == "__main__":
+    main()
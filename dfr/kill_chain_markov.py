@@ -0,0 +1,118 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Exact stage probabilities of the kill chain (see dfr.kill_chain).
+
+For fixed posture, resources and motivation the chain is a finite Markov
+process. Its state holds what later stages read: one bit per stage that gates
+or feeds a later stage, plus the resource increase of develop_resources()
+(none or 5..15). Each stage is a transition over those states that either
+leaves a state (failure) or sets the stage's bit (success) with the stage's
+clipped chance; after the last stage every state is absorbing. The transitions
+are applied to the whole state distribution as array shifts, for every
+(posture, resources, motivation) triple at once, so no campaign is sampled.
+"""
+import numpy as np
+import pandas as pd
+
+from dfr.kill_chain import RESOURCE_INCREASE, STAGE_NAMES, STAGES, stage_chance
+
+# Term features that read an earlier stage's outcome
+_FEATURE_STAGES = {
+    "recon_vulnerabilities": "perform_reconnaissance",
+    "discovered_systems": "enumerate_systems",
+    "collected_data": "collect_data",
+}
+
+
+def _memory_stages():
+    # Stages whose outcome a later stage reads as a term or requires
+    names = set()
+    for stage in STAGES:
+        names.update(stage["requires"])
+        for term in stage["terms"]:
+            feature = _FEATURE_STAGES.get(term[1], term[1])
+            if feature in STAGE_NAMES:
+                names.add(feature)
+    return tuple(name for name in STAGE_NAMES if name in names)
+
+
+MEMORY_STAGES = _memory_stages()
+_INCREASES = np.concatenate([[0], np.arange(RESOURCE_INCREASE[0], RESOURCE_INCREASE[1] + 1)])
+# State index = increase index * 2**len(MEMORY_STAGES) + stage bits
+_N_BITS = 2 ** len(MEMORY_STAGES)
+N_STATES = len(_INCREASES) * _N_BITS
+_STATE_BITS = np.arange(N_STATES) % _N_BITS
+_STATE_INCREASE = _INCREASES[np.arange(N_STATES) // _N_BITS]
+
+
+def _state_outcomes():
+    return {name: (_STATE_BITS >> bit & 1).astype(bool) for bit, name in enumerate(MEMORY_STAGES)}
+
+
+def stage_probabilities(defender_posture, attacker_resources, attacker_motivation):
+    """
+    Exact probability of every stage succeeding (its reach in funnel()).
+
+    Args:
+        defender_posture (float or ndarray): Defender posture (0-1).
+        attacker_resources (float or ndarray): Attacker resources (0-100).
+        attacker_motivation (float or ndarray): Attacker motivation (0-100).
+        The arguments are broadcast against each other for what-if grids.
+
+    Returns:
+        dict: Stage name -> success probability (shaped like the broadcast arguments),
+        and "absorbing_distribution", the final (..., N_STATES) state distribution.
+    """
+    posture, resources, motivation = np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in (defender_posture, attacker_resources, attacker_motivation)))
+    shape = posture.shape
+    distribution = np.zeros(shape + (N_STATES,))
+    distribution[..., 0] = 1.0  # No stage done, no resource increase
+    outcomes = _state_outcomes()
+    state_resources = resources[..., None] + _STATE_INCREASE
+
+    probabilities = {}
+    for stage in STAGES:
+        active = np.ones(N_STATES, dtype=bool)
+        for required in stage["requires"]:
+            active &= outcomes[required]
+        chance = stage_chance(stage, posture[..., None], state_resources, outcomes, motivation[..., None])
+        chance = np.clip(chance, 0, 1) * active
+        moved = distribution * chance
+        probabilities[stage["name"]] = moved.sum(axis=-1)
+
+        if stage["name"] == "develop_resources":
+            # Success spreads the mass evenly over the resource increases
+            distribution = distribution - moved
+            for k in range(1, len(_INCREASES)):
+                distribution[..., k * _N_BITS:(k + 1) * _N_BITS] += moved[..., :_N_BITS] / (len(_INCREASES) - 1)
+        elif stage["name"] in MEMORY_STAGES:
+            bit = 1 << MEMORY_STAGES.index(stage["name"])
+            source = np.flatnonzero((_STATE_BITS & bit) == 0)
+            distribution = distribution - moved
+            distribution[..., source + bit] += moved[..., source]
+
+    probabilities["absorbing_distribution"] = distribution
+    return probabilities
+
+
+def funnel_table(defender_posture, attacker_resources, attacker_motivation):
+    """
+    Exact reach per stage for scalar arguments, in the layout of funnel().
+    """
+    probabilities = stage_probabilities(defender_posture, attacker_resources, attacker_motivation)
+    return pd.DataFrame({"stage": STAGE_NAMES, "reach": [float(probabilities[name]) for name in STAGE_NAMES]})
+
+
+def main():
+    print(funnel_table(defender_posture=0.6, attacker_resources=60, attacker_motivation=70).to_string())
+    # Posture what-if: probability of deliver_impact over a grid of postures
+    postures = np.linspace(0, 1, 11)
+    impact = stage_probabilities(postures, 60, 70)["deliver_impact"]
+    for posture, probability in zip(postures, impact):
+        print(f"Posture {posture:.1f}: deliver_impact {probability:.4f}")
+
+
+if __name__ == "__main__":
+    main()
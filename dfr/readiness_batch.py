@@ -0,0 +1,113 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Array versions of the readiness game functions (readiness-training.py).
+
+fuzzy_readiness() evaluates the same membership and averaging expressions as
+the scalar function, in the same order, so each element matches the scalar
+result bit for bit. simulate_games() plays whole batches of games quietly into
+a GameLog. readiness_rule_base() restates the readiness model as fuzzy rules
+over the same sets for the inference engine in dfr.fuzzy.
+"""
+import numpy as np
+
+from dfr.fuzzy import LinguisticVariable, Rule, RuleBase
+from dfr.game_log import GameLog
+from dfr.readiness_training import EXPERIENCE_SETS, TRAINING_SETS, VULNERABILITY_SETS
+
+
+def _membership(values, sets):
+    # Same expression (and branch) as the scalar min(max(...)) membership
+    low, mid, high = sets
+    if low[0] < mid[0]:
+        return np.minimum(np.maximum(0, (values - low[0]) / (mid[0] - low[0])), 1)
+    return np.minimum(np.maximum(0, (high[1] - values) / (high[1] - mid[1])), 1)
+
+
+def fuzzy_readiness(training, experience, vulnerability):
+    """
+    Array version of fuzzy_readiness() from readiness-training.py.
+
+    Args:
+        training (ndarray): Defender training levels.
+        experience (ndarray): Defender experience levels.
+        vulnerability (ndarray): Attacker capability (CVSS scores).
+
+    Returns:
+        ndarray: Readiness of each (training, experience, vulnerability) triple, broadcast
+        against each other.
+    """
+    train_value = _membership(np.asarray(training, dtype=np.float64), TRAINING_SETS)
+    exp_value = _membership(np.asarray(experience, dtype=np.float64), EXPERIENCE_SETS)
+    vuln_value = _membership(np.asarray(vulnerability, dtype=np.float64), VULNERABILITY_SETS)
+
+    # Simple averaging for simplicity (more complex fuzzy rules can be implemented)
+    return (train_value + exp_value + (1 - vuln_value)) / 3
+
+
+def simulate_games(n_games, rng=None, log=None, training_range=(70, 90), experience_range=(7, 10),
+                   capability_range=(0.1, 10.0)):
+    """
+    Array version of simulate_game(): plays n_games games without printing.
+
+    Args:
+        n_games (int): Number of games.
+        rng: numpy Generator or seed for the random draws.
+        log (GameLog): Log receiving the games; a new one is created when None.
+        training_range (tuple): Inclusive range of the defender training level.
+        experience_range (tuple): Inclusive range of the defender experience level.
+        capability_range (tuple): Range of the attacker capability (CVSS score).
+
+    Returns:
+        GameLog: The log holding the games.
+    """
+    rng = np.random.default_rng(rng)
+    if log is None:
+        log = GameLog(n_games)
+    defender_training = rng.integers(training_range[0], training_range[1], n_games, endpoint=True)
+    defender_experience = rng.integers(experience_range[0], experience_range[1], n_games, endpoint=True)
+    attacker_capability = rng.uniform(capability_range[0], capability_range[1], n_games)
+
+    defender_readiness = fuzzy_readiness(defender_training, defender_experience, attacker_capability)
+    attacker_advantage = rng.uniform(0.0, 1.0, n_games)
+
+    # Simple win/lose logic based on readiness and attacker advantage
+    defenders_win = defender_readiness > (attacker_advantage + 0.2)
+    log.extend(defenders_win, defender_training, defender_experience, defender_readiness, attacker_advantage,
+               attacker_capability)
+    return log
+
+
+def readiness_rule_base(method="mamdani"):
+    """
+    Rule-based readiness model over the fuzzy_readiness() sets.
+
+    Args:
+        method (str): "mamdani" (readiness sets low/medium/high on [0, 1]) or "sugeno"
+            (constant readiness 0.2/0.5/0.9).
+
+    Returns:
+        RuleBase: Inputs training, experience and vulnerability; compile() it to evaluate.
+    """
+    terms = ("low", "mid", "high")
+    training = LinguisticVariable("training", (0, 100), dict(zip(terms, TRAINING_SETS)))
+    experience = LinguisticVariable("experience", (0, 10), dict(zip(terms, EXPERIENCE_SETS)))
+    vulnerability = LinguisticVariable("vulnerability", (0, 10), dict(zip(terms, VULNERABILITY_SETS)))
+    if method == "mamdani":
+        output = LinguisticVariable("readiness", (0, 1), {"low": (0, 0, 0.5), "mid": (0.25, 0.5, 0.75),
+                                                          "high": (0.5, 1, 1)})
+        levels = {term: term for term in terms}
+    else:
+        output = "readiness"
+        levels = {"low": 0.2, "mid": 0.5, "high": 0.9}
+
+    rules = [
+        Rule({"training": "high", "experience": "high", "vulnerability": "low"}, levels["high"]),
+        Rule({"training": "high", "experience": "high", "vulnerability": "mid"}, levels["mid"]),
+        Rule({"training": "mid", "experience": "mid"}, levels["mid"]),
+        Rule({"training": "high", "experience": "mid"}, levels["mid"]),
+        Rule({"training": "mid", "experience": "high"}, levels["mid"]),
+        Rule({"training": "low", "experience": "low"}, levels["low"], operator="or"),
+        Rule({"vulnerability": "high"}, levels["low"]),
+    ]
+    return RuleBase([training, experience, vulnerability], output, rules, method=method)
@@ -0,0 +1,136 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Seniority profiles of the readiness game (readiness-training.py).
+
+The note at the bottom of readiness-training.py lists the training and
+experience ranges of three defender teams. Each profile here is one of those
+scenarios; run_profiles() plays all of them at once in a process pool, every
+profile on its own child of one SeedSequence, and returns per-profile defender
+win-rate distributions and readiness histograms.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dfr.readiness_batch import simulate_games
+from dfr.rendering import render
+
+# Training and experience ranges from readiness-training.py
+PROFILES = {
+    "junior-mid-senior": {"training_range": (40, 90), "experience_range": (4, 10), "capability_range": (0.1, 10.0)},
+    "mid-senior": {"training_range": (60, 90), "experience_range": (6, 10), "capability_range": (0.1, 10.0)},
+    "senior": {"training_range": (70, 90), "experience_range": (7, 10), "capability_range": (0.1, 10.0)},
+}
+
+
+def run_profile(name, profile, n_batches, games_per_batch, seed, bins=20):
+    """
+    Plays n_batches batches of games for one profile.
+
+    Args:
+        name (str): Profile name.
+        profile (dict): training_range, experience_range and capability_range of simulate_games().
+        n_batches (int): Number of batches; each gives one defender win rate.
+        games_per_batch (int): Games per batch.
+        seed: SeedSequence (or seed) for this profile's random stream.
+        bins (int): Number of readiness histogram bins over [0, 1].
+
+    Returns:
+        dict: name, the (n_batches,) win_rates, the readiness_histogram counts and bin_edges.
+    """
+    rng = np.random.default_rng(seed)
+    bin_edges = np.linspace(0, 1, bins + 1)
+    readiness_histogram = np.zeros(bins, dtype=np.int64)
+    win_rates = np.empty(n_batches)
+    for batch in range(n_batches):
+        games = simulate_games(games_per_batch, rng=rng, **profile).games
+        win_rates[batch] = games["defenders_win"].mean()
+        readiness_histogram += np.histogram(games["readiness"], bin_edges)[0]
+    return {
+        "name": name,
+        "win_rates": win_rates,
+        "readiness_histogram": readiness_histogram,
+        "bin_edges": bin_edges,
+    }
+
+
+def _run_job(job):
+    return run_profile(*job)
+
+
+def run_profiles(profiles=None, n_batches=100, games_per_batch=10_000, seed=0, processes=None, bins=20):
+    """
+    Runs every profile in a process pool.
+
+    Args:
+        profiles (dict): Named profiles, PROFILES when None.
+        n_batches (int): Batches (win-rate samples) per profile.
+        games_per_batch (int): Games per batch.
+        seed (int): Root seed; profile i always uses child i of SeedSequence(seed).
+        processes (int): Worker processes, defaults to the number of CPUs. 1 runs in-process.
+        bins (int): Number of readiness histogram bins.
+
+    Returns:
+        dict: run_profile() result per profile name, in profile order.
+    """
+    profiles = PROFILES if profiles is None else profiles
+    seeds = np.random.SeedSequence(seed).spawn(len(profiles))
+    jobs = [(name, profile, n_batches, games_per_batch, profile_seed, bins)
+            for (name, profile), profile_seed in zip(profiles.items(), seeds)]
+
+    processes = min(processes or os.cpu_count(), len(jobs))
+    if processes <= 1:
+        results = [_run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_run_job, jobs))
+    return {result["name"]: result for result in results}
+
+
+def profile_summary(results, quantiles=(0.05, 0.5, 0.95)):
+    """
+    One row per profile with the mean, standard deviation and quantiles of its win rates.
+    """
+    rows = []
+    for name, result in results.items():
+        win_rates = result["win_rates"]
+        row = {"profile": name, "win_rate_mean": win_rates.mean(), "win_rate_std": win_rates.std()}
+        for quantile, value in zip(quantiles, np.quantile(win_rates, quantiles)):
+            row[f"win_rate_q{quantile:g}"] = value
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def main():
+    results = run_profiles()
+    print(profile_summary(results).to_string())
+
+    def plot_win_rates(plt):
+        for name, result in results.items():
+            plt.hist(result["win_rates"], bins=20, alpha=0.6, label=name)
+        plt.xlabel("Defender Win Rate")
+        plt.ylabel("Frequency")
+        plt.title("Defender Win Rate per Seniority Profile")
+        plt.legend()
+        plt.grid(True)
+        plt.tight_layout()
+
+    def plot_readiness(plt):
+        for name, result in results.items():
+            plt.stairs(result["readiness_histogram"], result["bin_edges"], label=name)
+        plt.xlabel("Defender Readiness")
+        plt.ylabel("Games")
+        plt.title("Defender Readiness per Seniority Profile")
+        plt.legend()
+        plt.grid(True)
+        plt.tight_layout()
+
+    render("profile-win-rates", plot_win_rates)
+    render("profile-readiness", plot_readiness)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Fuzzy defender readiness game (readiness-training.py).
+"""
+import random
+
+# Triangular membership functions (low, medium, high) used by fuzzy_readiness()
+TRAINING_SETS = ((0, 20, 50), (30, 60, 90), (70, 100, 100))
+EXPERIENCE_SETS = ((0, 2, 5), (3, 7, 10), (8, 10, 10))
+VULNERABILITY_SETS = ((0, 0, 3), (2, 5, 8), (7, 10, 10))
+# cvss_to_severity() levels, indexed by severity code
+SEVERITY_LABELS = ("Red (High)", "Orange (Medium)", "Green (low)", "Gray (Unknown)")
+
+def cvss_to_severity(score):
+  """
+  Maps CVSS score to a severity level (color).
+  """
+  if score >= 7.0:
+    return "Red (High)"
+  elif score >= 4.0:
+    return "Orange (Medium)"
+  elif score >= 0.1:
+    return "Green (low)"
+  else:
+    return "Gray (Unknown)"
+
+def fuzzy_readiness(training, experience, vulnerability):
+  """
+  Simulates readiness using fuzzy logic (triangular membership functions).
+  """
+  low_train, mid_train, high_train = TRAINING_SETS
+  low_exp, mid_exp, high_exp = EXPERIENCE_SETS
+  low_vuln, mid_vuln, high_vuln = VULNERABILITY_SETS
+
+  train_value = min(max(0, (training - low_train[0]) / (mid_train[0] - low_train[0])), 1) \
+                if low_train[0] < mid_train[0] else min(max(0, (high_train[1] - training) / (high_train[1] - mid_train[1])), 1)
+  exp_value = min(max(0, (experience - low_exp[0]) / (mid_exp[0] - low_exp[0])), 1) \
+               if low_exp[0] < mid_exp[0] else min(max(0, (high_exp[1] - experience) / (high_exp[1] - mid_exp[1])), 1)
+  vuln_value = min(max(0, (vulnerability - low_vuln[0]) / (mid_vuln[0] - low_vuln[0])), 1) \
+                if low_vuln[0] < mid_vuln[0] else min(max(0, (high_vuln[1] - vulnerability) / (high_vuln[1] - mid_vuln[1])), 1)
+
+  # Simple averaging for simplicity (more complex fuzzy rules can be implemented)
+  readiness = (train_value + exp_value + (1 - vuln_value)) / 3
+  return readiness
+
+def simulate_game(verbose=True, log=None):
+  """
+  Simulates a single game between defenders and attackers.
+
+  Args:
+      verbose (bool): Print the outcome of the game (False for quiet runs).
+      log (GameLog): Optional event log receiving the game.
+
+  Returns:
+      tuple: (defender_training, defender_readiness, attacker_capability)
+  """
+  defender_training = random.randint(70, 90)  # Simulate random training level
+  defender_experience = random.randint(7, 10)  # Simulate random experience level
+  attacker_capability = random.uniform(0.1, 10.0)  # Simulate random CVSS score
+
+  defender_readiness = fuzzy_readiness(defender_training, defender_experience, attacker_capability)
+  attacker_advantage = random.uniform(0.0, 1.0)  # Simulate random attacker advantage
+
+  # Simple win/lose logic based on readiness and attacker advantage
+  defenders_win = defender_readiness > (attacker_advantage + 0.2)
+  if log is not None:
+    log.append(defenders_win, defender_training, defender_experience, defender_readiness, attacker_advantage,
+               attacker_capability, cvss_to_severity(attacker_capability))
+  if verbose:
+    if defenders_win:
+      print(f"Defenders win! Readiness: {defender_readiness:.2f} (high), Vulnerability: {attacker_capability:.1f} ({cvss_to_severity(attacker_capability)})")
+    else:
+      print(f"Attackers win! Readiness: {defender_readiness:.2f}, Advantage: {attacker_advantage:.2f}, Vulnerability: {attacker_capability:.1f} ({cvss_to_severity(attacker_capability)})")
+
+  return defender_training, defender_readiness, attacker_capability
@@ -0,0 +1,155 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Compact reconnaissance and discovery state for the attacker tactics.
+
+perform_reconnaissance() used to return a dict of Python lists of IP addresses,
+services and CVE IDs, and enumerate_systems() a list of system names, although
+the later stages only count them. Here every finding is a bit in a mask over a
+fixed catalogue, held in immutable __slots__ objects, and the human-readable dict or list
+is only built when asked for with to_dict() / to_list().
+"""
+
+# Catalogues of what the tactics can find, indexed by bit position
+IP_ADDRESSES = ("10.0.1.1", "10.0.1.20")
+SERVICES = ("SSH", "HTTP")
+VULNERABILITIES = ("CVE-2023-1234", "CVE-2024-5678")
+SYSTEMS = ("server1", "client2", "printer3")
+
+
+def _items(catalogue, mask):
+    return [item for bit, item in enumerate(catalogue) if mask >> bit & 1]
+
+
+def _mask(catalogue, items):
+    mask = 0
+    for item in items:
+        try:
+            mask |= 1 << catalogue.index(item)
+        except ValueError:
+            raise ValueError(f"Invalid finding '{item}'. It is not in the catalogue.") from None
+    return mask
+
+
+def full_mask(catalogue):
+    """
+    Mask with every entry of a catalogue set.
+    """
+    return (1 << len(catalogue)) - 1
+
+
+class ReconInfo:
+    """
+    Findings of perform_reconnaissance() as bitmasks over IP_ADDRESSES, SERVICES and
+    VULNERABILITIES. Empty findings are falsy, like the empty dict they replace.
+    Instances are immutable and hashable.
+    """
+
+    __slots__ = ("_ip_addresses", "_services", "_vulnerabilities")
+
+    def __init__(self, ip_addresses=0, services=0, vulnerabilities=0):
+        self._ip_addresses = ip_addresses
+        self._services = services
+        self._vulnerabilities = vulnerabilities
+
+    @property
+    def ip_addresses(self):
+        return self._ip_addresses
+
+    @property
+    def services(self):
+        return self._services
+
+    @property
+    def vulnerabilities(self):
+        return self._vulnerabilities
+
+    def __bool__(self):
+        return bool(self._ip_addresses or self._services or self._vulnerabilities)
+
+    def __eq__(self, other):
+        return (isinstance(other, ReconInfo) and self._ip_addresses == other._ip_addresses
+                and self._services == other._services and self._vulnerabilities == other._vulnerabilities)
+
+    def __hash__(self):
+        return hash((ReconInfo, self._ip_addresses, self._services, self._vulnerabilities))
+
+    def __repr__(self):
+        return f"ReconInfo({self.to_dict()})"
+
+    @property
+    def vulnerability_count(self):
+        return bin(self.vulnerabilities).count("1")
+
+    def to_dict(self):
+        """
+        The human-readable dict perform_reconnaissance() used to return.
+        """
+        recon_info = {}
+        if self.ip_addresses:
+            recon_info["ip_addresses"] = _items(IP_ADDRESSES, self.ip_addresses)
+        if self.services:
+            recon_info["services"] = _items(SERVICES, self.services)
+        if self.vulnerabilities:
+            recon_info["vulnerabilities"] = _items(VULNERABILITIES, self.vulnerabilities)
+        return recon_info
+
+    def get(self, key, default=None):
+        """
+        dict-style access to the rendered findings, for code written against the dict.
+        """
+        return self.to_dict().get(key, default)
+
+    @classmethod
+    def from_dict(cls, recon_info):
+        return cls(_mask(IP_ADDRESSES, recon_info.get("ip_addresses", ())),
+                   _mask(SERVICES, recon_info.get("services", ())),
+                   _mask(VULNERABILITIES, recon_info.get("vulnerabilities", ())))
+
+
+class SystemSet:
+    """
+    Systems found by enumerate_systems() as a bitmask over SYSTEMS. Behaves like the
+    list it replaces for len(), truth value and iteration. Instances are immutable
+    and hashable.
+    """
+
+    __slots__ = ("_mask",)
+
+    def __init__(self, mask=0):
+        self._mask = mask
+
+    @property
+    def mask(self):
+        return self._mask
+
+    def __len__(self):
+        return bin(self._mask).count("1")
+
+    def __bool__(self):
+        return self._mask != 0
+
+    def __iter__(self):
+        return iter(_items(SYSTEMS, self._mask))
+
+    def __eq__(self, other):
+        return isinstance(other, SystemSet) and self._mask == other._mask
+
+    def __hash__(self):
+        return hash((SystemSet, self._mask))
+
+    def __repr__(self):
+        return f"SystemSet({self.to_list()})"
+
+    def to_list(self):
+        return _items(SYSTEMS, self.mask)
+
+    @classmethod
+    def from_list(cls, systems):
+        return cls(_mask(SYSTEMS, systems))
+
+
+# Shared instances of the complete and empty findings
+FULL_RECON = ReconInfo(full_mask(IP_ADDRESSES), full_mask(SERVICES), full_mask(VULNERABILITIES))
+NO_RECON = ReconInfo()
+ALL_SYSTEMS = SystemSet(full_mask(SYSTEMS))
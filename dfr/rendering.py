@@ -0,0 +1,72 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Deferred plotting for the simulation scripts.
+
+Scripts hand a drawing function to render() instead of calling matplotlib at
+the top level. matplotlib is only imported when the first plot is actually
+drawn, and the mode decides what happens to it:
+
+    show  draw and display interactively (plt.show())
+    save  draw with the non-interactive Agg backend and write a PNG file
+    off   skip plotting entirely (matplotlib is never imported)
+
+The mode and output directory come from the DFR_PLOTS and DFR_PLOT_DIR
+environment variables, or from configure().
+"""
+import os
+
+_settings = {
+    "mode": os.environ.get("DFR_PLOTS", "show"),
+    "output_dir": os.environ.get("DFR_PLOT_DIR", "plots"),
+}
+_MODES = ("show", "save", "off")
+
+
+def configure(mode=None, output_dir=None):
+    """
+    Changes the plotting mode ("show", "save" or "off") and/or the output directory.
+    """
+    if mode is not None:
+        if mode not in _MODES:
+            raise ValueError("Invalid plotting mode. Choose 'show', 'save' or 'off'.")
+        _settings["mode"] = mode
+    if output_dir is not None:
+        _settings["output_dir"] = output_dir
+
+
+def _pyplot():
+    import matplotlib
+    if _settings["mode"] == "save":
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def render(name, draw, **figure_kwargs):
+    """
+    Draws one figure according to the current mode.
+
+    Args:
+        name (str): Figure name, used as the file name in save mode.
+        draw (callable): Called as draw(plt) on a fresh figure to draw the plot.
+        **figure_kwargs: Passed to plt.figure() (e.g. figsize).
+
+    Returns:
+        str: Path of the written file in save mode, None otherwise.
+    """
+    if _settings["mode"] not in _MODES:
+        raise ValueError("Invalid plotting mode. Choose 'show', 'save' or 'off'.")
+    if _settings["mode"] == "off":
+        return None
+    plt = _pyplot()
+    figure = plt.figure(**figure_kwargs)
+    draw(plt)
+    if _settings["mode"] == "show":
+        plt.show()
+        return None
+    os.makedirs(_settings["output_dir"], exist_ok=True)
+    path = os.path.join(_settings["output_dir"], name + ".png")
+    figure.savefig(path)
+    plt.close(figure)
+    return path
@@ -0,0 +1,199 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Streaming writer for SME/SMB round results.
+
+Rounds are flattened into the same columns as sim-SME-SMB.csv and buffered in
+fixed-size column arrays; every full buffer is appended to a Parquet or CSV file
+and reused, so memory does not grow with the number of rounds.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from dfr.sme_smb_codes import ATTACK_TYPE_LABELS, IMPACT_LABELS
+
+# Per-attack columns; the SME and SMB copies both hold the first attack of the round
+ATTACK_COLUMNS = ("attack_type", "maliciousness", "attack_strength", "potential_impact", "cvss_base_score")
+ROUND_COLUMNS = ("total_workload", "impact_availability", "impact_confidentiality", "impact_integrity")
+COLUMNS = tuple(
+    f"attack_results_{category}_{column}" for category in ("SME", "SMB") for column in ATTACK_COLUMNS
+) + ROUND_COLUMNS
+
+_LABELS = {"attack_type": ATTACK_TYPE_LABELS, "potential_impact": IMPACT_LABELS}
+_CODES = {name: {label: code for code, label in enumerate(labels)} for name, labels in _LABELS.items()}
+# Buffer column behind each output column
+_SOURCE = {name: name.split("_", 3)[3] if name.startswith("attack_results_") else name for name in COLUMNS}
+
+
+def flatten_rounds(attacks, rounds):
+    """
+    Vectorized form of the Outputs_updated flattening in SME-SMB.py.
+
+    Args:
+        attacks (ndarray): Attack array returned by attack_rounds().
+        rounds (ndarray): Round array returned by attack_rounds().
+
+    Returns:
+        dict: Column arrays keyed by attack and round column name. attack_type and
+        potential_impact are integer codes, -1 for rounds without any attack.
+    """
+    active = attacks["active"]
+    has_attack = active.any(axis=1)
+    first = attacks[np.arange(len(attacks)), np.argmax(active, axis=1)]
+    columns = {}
+    for column in ATTACK_COLUMNS:
+        if column in _LABELS:
+            columns[column] = np.where(has_attack, first[column], -1).astype(np.int8)
+        else:
+            columns[column] = np.where(has_attack, first[column], 0.0)
+    for column in ROUND_COLUMNS:
+        columns[column] = rounds[column]
+    return columns
+
+
+class RoundSink:
+    """
+    Appends flattened rounds to a Parquet (.parquet) or CSV (.csv) file in chunks.
+
+    Args:
+        path (str): Output file; the format is taken from the extension.
+        chunk_size (int): Rounds buffered before each write.
+    """
+
+    def __init__(self, path, chunk_size=100_000):
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".parquet", ".pq"):
+            self.format = "parquet"
+        elif extension == ".csv":
+            self.format = "csv"
+        else:
+            raise ValueError("Invalid output file. Use a .parquet or .csv extension.")
+        self.path = path
+        self.chunk_size = chunk_size
+        self.rows_written = 0
+        self._size = 0
+        self._buffer = {}
+        for column in ATTACK_COLUMNS + ROUND_COLUMNS:
+            dtype = np.int8 if column in _LABELS else np.float64
+            self._buffer[column] = np.empty(chunk_size, dtype=dtype)
+        self._writer = None
+        self._file = None
+
+    def write(self, attacks, rounds):
+        """
+        Buffers a batch from attack_rounds(), writing every chunk that fills up.
+        """
+        self.write_columns(flatten_rounds(attacks, rounds))
+
+    def write_columns(self, columns):
+        """
+        Buffers already flattened column arrays (see flatten_rounds()).
+        """
+        n = len(columns[ROUND_COLUMNS[0]])
+        start = 0
+        while start < n:
+            take = min(self.chunk_size - self._size, n - start)
+            for column, values in self._buffer.items():
+                values[self._size:self._size + take] = columns[column][start:start + take]
+            self._size += take
+            start += take
+            if self._size == self.chunk_size:
+                self.flush()
+
+    def append(self, output):
+        """
+        Buffers a single round dictionary as returned by attack_round().
+        """
+        index = self._size
+        if output["attack_results"]:
+            first = output["attack_results"][0]
+            for column in ATTACK_COLUMNS:
+                if column in _LABELS:
+                    self._buffer[column][index] = _CODES[column][first[column]]
+                else:
+                    self._buffer[column][index] = first[column]
+        else:
+            for column in ATTACK_COLUMNS:
+                self._buffer[column][index] = -1 if column in _LABELS else 0
+        for column in ROUND_COLUMNS:
+            self._buffer[column][index] = output[column]
+        self._size += 1
+        if self._size == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered rounds to the output file.
+        """
+        if self._size == 0:
+            return
+        if self.format == "parquet":
+            self._flush_parquet()
+        else:
+            self._flush_csv()
+        self.rows_written += self._size
+        self._size = 0
+
+    def close(self):
+        """
+        Writes any remaining rounds and closes the output file.
+        """
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _flush_csv(self):
+        columns = {}
+        for name in COLUMNS:
+            column = _SOURCE[name]
+            values = self._buffer[column][:self._size]
+            if column in _LABELS:
+                # Rounds without an attack are written as 0, like the original export
+                values = np.array(_LABELS[column] + ("0",), dtype=object)[values]
+            columns[name] = values
+        frame = pd.DataFrame(columns, index=pd.RangeIndex(self.rows_written, self.rows_written + self._size))
+        if self._file is None:
+            self._file = open(self.path, "w", newline="")
+            frame.to_csv(self._file)
+        else:
+            frame.to_csv(self._file, header=False)
+
+    def _flush_parquet(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrays = []
+        for name in COLUMNS:
+            column = _SOURCE[name]
+            values = self._buffer[column][:self._size]
+            if column in _LABELS:
+                # Rounds without an attack have no label (null) in the Parquet output
+                indices = pa.array(values, mask=values < 0)
+                arrays.append(pa.DictionaryArray.from_arrays(indices, pa.array(_LABELS[column])))
+            else:
+                arrays.append(pa.array(values))
+        table = pa.Table.from_arrays(arrays, names=list(COLUMNS))
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+
+
+def read_results(path):
+    """
+    Loads a file written by RoundSink into a DataFrame.
+    """
+    if os.path.splitext(path)[1].lower() in (".parquet", ".pq"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, index_col=0)
@@ -0,0 +1,96 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+SME/SMB attack round model (SME-SMB.py, SME-SMB-IRRATIONAL.py).
+"""
+import random
+
+from dfr.sme_smb_codes import attack_intensity, defense_effectiveness, estimate_cvss_base, maliciousness
+
+
+def attack_round(attacker_pool, defender_resources, category, irrational_behavior=0.0):
+    """
+    This function simulates a single round of attack and defense actions.
+
+    Args:
+        attacker_pool (list): A list representing the attacker pool (types of attackers with probabilities).
+        defender_resources (float): A value between 0 and 1 representing the defender's resources.
+        category (str): The category of the defender (SME or SMB).
+        irrational_behavior (float): Chance that an attacker acts irrationally and draws a random
+            maliciousness (0 in SME-SMB.py, 0.8 in SME-SMB-IRRATIONAL.py).
+
+    Returns:
+        dict: A dictionary containing the results of the attack round.
+    """
+
+    # Simulate attacker actions
+    attack_results = []
+    for attacker_type, probability in attacker_pool:
+        if random.random() < probability:  # Simulate attacker selection based on probability
+            # Introduce irrational behavior with a chance (e.g., 10%)
+            if irrational_behavior > 0 and random.random() < irrational_behavior:
+                malicious_score = random.uniform(0, 1)  # Random maliciousness for irrational attackers
+            else:
+                malicious_score = maliciousness(attacker_type, category)
+            attack_type = random.choice(["DDoS", "SQL Injection"])
+            attack_strength = attack_intensity(malicious_score)
+            potential_impact = random.choice(["High", "Medium", "Low"])  # Random impact for now
+            cvss_base_score = estimate_cvss_base(attack_type, potential_impact)
+            attack_results.append({
+                "attack_type": attack_type,
+                "maliciousness": malicious_score,
+                "attack_strength": attack_strength,
+                "potential_impact": potential_impact,
+                "cvss_base_score": cvss_base_score
+            })
+
+    # Calculate total attack workload
+    total_workload = sum(result["attack_strength"] for result in attack_results)
+
+    # Calculate defense effectiveness considering workload
+    defense_modifier = defense_effectiveness(defender_resources, total_workload, category)
+
+    # Simulate impact on metrics (consider CVSS scores and potential impacts)
+    impact_availability = max(0, sum(result["attack_strength"] for result in attack_results) - defense_modifier * 0.6)
+    impact_confidentiality = 0
+    impact_integrity = 0
+    for result in attack_results:
+        if result["attack_type"] == "SQL Injection":
+            # Consider defense effectiveness on impact for successful attacks
+            impact_modifier = 1 - defense_modifier  # Higher defense reduces impact
+            if result["potential_impact"] == "High":
+                impact_confidentiality = max(impact_confidentiality, result["cvss_base_score"] * impact_modifier)
+                impact_integrity = max(impact_integrity, result["cvss_base_score"] * impact_modifier)
+            elif result["potential_impact"] == "Medium":
+                impact_confidentiality = max(impact_confidentiality, result["cvss_base_score"] * 0.5 * impact_modifier)
+                impact_integrity = max(impact_integrity, result["cvss_base_score"] * 0.5 * impact_modifier)
+        # Handle DDoS impact specifically
+        elif result["attack_type"] == "DDoS":
+            if result["potential_impact"] == "High":
+                impact_availability = 0.8  # Set a high value for high-impact DDoS (assuming severe disruption)
+            else:
+                impact_availability = max(0, impact_availability - result["attack_strength"] * defense_modifier * 0.2)  # Lower impact for low/medium DDoS
+
+    # Return the attack round results
+    return {
+        "attack_results": attack_results,
+        "total_workload": total_workload,
+        "impact_availability": impact_availability,
+        "impact_confidentiality": impact_confidentiality,
+        "impact_integrity": impact_integrity
+    }
+
+
+# Define attacker pools with adjusted probabilities for SMEs and SMBs
+SME_attacker_pool = [
+    ("Script Kiddie", 0.7),  # Higher probability for SMEs
+    ("Disgruntled Insider", 0.2),
+    ("Organized Crime", 0.1)
+]
+SMB_attacker_pool = [
+    ("Script Kiddie", 0.5),
+    ("Disgruntled Insider", 0.2),
+    ("Organized Crime", 0.1),
+    ("Nation-State Actor", 0.2)  # Lower probability for SMEs
+]
+attacker_pools = {"SME": SME_attacker_pool, "SMB": SMB_attacker_pool}
@@ -0,0 +1,396 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Batched version of the SME/SMB attack round (SME-SMB.py, SME-SMB-IRRATIONAL.py).
+
+Without irrational behavior every attacker in the pool ends a round in one of a
+handful of states (inactive, or one of the attack type/impact pairs), so the
+whole round is a function of the joint state. Those joint states are resolved
+once with the same arithmetic as attack_round() and rounds are then sampled as
+indices into that table. Irrational attackers draw a continuous maliciousness,
+so with irrational behavior the table holds only the discrete part of a round
+(who is active, rational or irrational, with which attack type and impact) and
+the maliciousness of the irrational attackers is drawn afterwards and added as
+array operations. Pools too large for a table resolve every round column by
+column.
+"""
+import random
+import time
+
+import numpy as np
+
+from dfr.sme_smb_codes import (ATTACK_TYPE_LABELS, CVSS_BASE, DEFENSE_BASE, IMPACT_LABELS, MALICIOUSNESS,
+                               AttackType, Impact, attack_intensity, attacker_type_code, category_code)
+
+# Largest joint-state table built: 4 attackers with irrational behavior (13 states per
+# attacker), 5 without (7 states per attacker)
+MAX_TABLE_STATES = 13 ** 4
+
+ATTACK_DTYPE = np.dtype([
+    ("active", np.bool_),
+    ("attack_type", np.int8),
+    ("maliciousness", np.float64),
+    ("attack_strength", np.float64),
+    ("potential_impact", np.int8),
+    ("cvss_base_score", np.float64),
+])
+
+ROUND_DTYPE = np.dtype([
+    ("total_workload", np.float64),
+    ("impact_availability", np.float64),
+    ("impact_confidentiality", np.float64),
+    ("impact_integrity", np.float64),
+])
+
+
+def defense_effectiveness(resources, workload, category):
+    """
+    Array version of defense_effectiveness() from SME-SMB.py.
+
+    Args:
+        resources (float): A value between 0 and 1 representing the defender's resources.
+        workload (ndarray): The total attack workload of each round.
+        category (Category): The category of the defender (SME or SMB).
+
+    Returns:
+        ndarray: Defense effectiveness of each round.
+    """
+    workload = np.asarray(workload, dtype=np.float64)
+    if resources < 0.5:
+        return np.full(workload.shape, float(resources))
+    return 1 - (1 - resources) * (DEFENSE_BASE[category] - workload * 0.2)
+
+
+def attack_rounds(attacker_pool, defender_resources, category, n_rounds, irrational_behavior=0.0, rng=None):
+    """
+    Simulates n_rounds independent attack rounds in one pass.
+
+    Args:
+        attacker_pool (list): (attacker type, probability) pairs, as in SME_attacker_pool. Types
+            may be labels or AttackerType codes.
+        defender_resources (float): A value between 0 and 1 representing the defender's resources.
+        category (str or Category): The category of the defender (SME or SMB).
+        n_rounds (int): Number of rounds to simulate.
+        irrational_behavior (float): Chance that an active attacker draws a random maliciousness
+            instead of the fuzzy value (0 reproduces SME-SMB.py, 0.8 SME-SMB-IRRATIONAL.py).
+        rng: numpy Generator or seed for the random draws.
+
+    Returns:
+        tuple: (attacks, rounds) where attacks is an (n_rounds, len(attacker_pool)) array of
+        ATTACK_DTYPE, one column per pool entry in pool order, and rounds is an (n_rounds,)
+        array of ROUND_DTYPE. attack_type and potential_impact hold AttackType and
+        Impact codes; inactive attackers have every field zeroed.
+    """
+    category = category_code(category)
+    attacker_types = np.array([attacker_type_code(t) for t, _ in attacker_pool], dtype=np.intp)
+    probabilities = np.array([p for _, p in attacker_pool], dtype=np.float64)
+    malicious_values = MALICIOUSNESS[attacker_types, category]
+    rng = np.random.default_rng(rng)
+    n_outcomes = len(AttackType) * len(Impact)
+
+    if irrational_behavior == 0 and (n_outcomes + 1) ** len(attacker_pool) <= MAX_TABLE_STATES:
+        attack_table, round_table, weights = _state_table(probabilities, malicious_values,
+                                                          defender_resources, category)
+        states = _sample_states(weights, n_rounds, rng)
+        return np.take(attack_table, states, axis=0), np.take(round_table, states)
+    if irrational_behavior > 0 and (2 * n_outcomes + 1) ** len(attacker_pool) <= MAX_TABLE_STATES:
+        return _irrational_rounds(probabilities, malicious_values, irrational_behavior, defender_resources,
+                                  category, n_rounds, rng)
+
+    shape = (len(attacker_pool), n_rounds)  # Attacker-major so each attacker's draws are contiguous
+    active = rng.random(shape) < probabilities[:, None]
+    outcome = rng.integers(0, n_outcomes, shape)
+    if irrational_behavior > 0:
+        irrational = rng.random(shape) < irrational_behavior
+        malicious_score = np.where(irrational, rng.random(shape), malicious_values[:, None])
+    else:
+        malicious_score = np.repeat(malicious_values, n_rounds).reshape(shape)
+    return _resolve(active, outcome, malicious_score, defender_resources, category)
+
+
+def _state_table(probabilities, malicious_values, defender_resources, category):
+    """
+    Resolves every joint attacker state of a rational pool.
+
+    Each attacker is either inactive (state 0) or active with outcome state - 1,
+    where outcome = attack_type * len(Impact) + potential_impact.
+
+    Returns:
+        tuple: (attacks, rounds, weights) with one row per joint state and its probability.
+    """
+    n_attackers = len(probabilities)
+    n_outcomes = len(AttackType) * len(Impact)
+    states = np.indices((n_outcomes + 1,) * n_attackers).reshape(n_attackers, -1)
+    active = states > 0
+    outcome = np.maximum(states - 1, 0)
+    malicious_score = np.repeat(malicious_values, states.shape[1]).reshape(states.shape)
+    attacks, rounds = _resolve(active, outcome, malicious_score, defender_resources, category)
+
+    state_probability = np.where(active, probabilities[:, None] / n_outcomes, 1 - probabilities[:, None])
+    weights = np.prod(state_probability, axis=0)
+    return attacks, rounds, weights
+
+
+def _irrational_rounds(probabilities, malicious_values, irrational_behavior, defender_resources, category,
+                       n_rounds, rng, chunk_size=32768):
+    """
+    attack_rounds() with irrational behavior, from a table of the discrete attacker states.
+
+    Each attacker is inactive (state 0), rational with outcome state - 1 or irrational
+    with outcome state - 1 - n_outcomes. Everything a round needs apart from the
+    irrational maliciousness is read from the table of the sampled joint state:
+    the attack columns, the largest confidentiality severity, whether a high-impact
+    DDoS resets availability to 0.8 and which later DDoS attacks lower it again.
+    """
+    n_attackers = len(probabilities)
+    n_outcomes = len(AttackType) * len(Impact)
+    states = np.indices((2 * n_outcomes + 1,) * n_attackers).reshape(n_attackers, -1)
+    active = states > 0
+    irrational = states > n_outcomes
+    outcome = np.where(active, (states - 1) % n_outcomes, 0)
+    attack_type = outcome // len(Impact)
+    potential_impact = outcome % len(Impact)
+    cvss_base_score = np.where(active, CVSS_BASE[attack_type, potential_impact], 0.0)
+    # Rational columns are final; irrational maliciousness and strength are drawn per round
+    malicious_score = np.where(active, malicious_values[:, None], 0.0)
+    attack_strength = attack_intensity(malicious_score)
+    attack_table = np.empty(states.shape[::-1], dtype=ATTACK_DTYPE)
+    attack_table["active"] = active.T
+    attack_table["attack_type"] = attack_type.T
+    attack_table["maliciousness"] = malicious_score.T
+    attack_table["attack_strength"] = attack_strength.T
+    attack_table["potential_impact"] = potential_impact.T
+    attack_table["cvss_base_score"] = cvss_base_score.T
+
+    # SQL injection severity before the impact modifier; max(a * m, b * m) == max(a, b) * m for m >= 0
+    sql_hit = active & (attack_type == AttackType.SQL_INJECTION) & (potential_impact != Impact.LOW)
+    severity = np.where(potential_impact == Impact.HIGH, cvss_base_score, cvss_base_score * 0.5)
+    severity_table = np.where(sql_hit, severity, 0.0).max(axis=0)
+    is_ddos = active & (attack_type == AttackType.DDOS)
+    ddos_high = is_ddos & (potential_impact == Impact.HIGH)
+    reset_table = ddos_high.any(axis=0)
+    # Only low/medium DDoS attacks after the last high-impact one still lower availability
+    later_high = np.flip(np.cumsum(np.flip(ddos_high, axis=0), axis=0), axis=0) - ddos_high
+    lower = is_ddos & ~ddos_high & (later_high == 0)
+    # 1 for an irrational attacker, 2 for one that also lowers availability
+    irrational_table = np.ascontiguousarray((irrational * (1 + lower)).T.astype(np.uint8))
+    # Workload and availability-lowering strength of the rational attackers;
+    # irrational strengths are added per round
+    workload_table = np.zeros(states.shape[1])
+    lower_table = np.zeros(states.shape[1])
+    for k in range(n_attackers):
+        rational_strength = np.where(irrational[k], 0.0, attack_strength[k])
+        workload_table += rational_strength
+        lower_table += np.where(lower[k], rational_strength, 0.0)
+
+    state_probability = np.where(active, probabilities[:, None] / n_outcomes, 1 - probabilities[:, None])
+    state_probability = state_probability * np.where(irrational, irrational_behavior,
+                                                     np.where(active, 1 - irrational_behavior, 1))
+    drawn = _sample_states(np.prod(state_probability, axis=0), n_rounds, rng)
+
+    attacks = np.take(attack_table, drawn, axis=0)
+    rounds = np.empty(n_rounds, dtype=ROUND_DTYPE)
+    # The per-round arithmetic runs in chunks small enough for its temporaries to stay in cache
+    for start in range(0, n_rounds, chunk_size):
+        chunk = drawn[start:start + chunk_size]
+        records = attacks[start:start + chunk_size].reshape(-1)
+        chunk_rounds = rounds[start:start + chunk_size]
+
+        # One uniform per irrational attacker, written in (round, attacker) record order
+        irrational_codes = np.take(irrational_table, chunk, axis=0).reshape(-1)
+        flagged = np.flatnonzero(irrational_codes != 0)
+        malicious_score = rng.random(len(flagged))
+        irrational_strength = attack_intensity(malicious_score)
+        records["maliciousness"][flagged] = malicious_score
+        records["attack_strength"][flagged] = irrational_strength
+
+        total_workload = workload_table[chunk]
+        total_workload += np.bincount(flagged // n_attackers, weights=irrational_strength, minlength=len(chunk))
+        defense_modifier = defense_effectiveness(defender_resources, total_workload, category)
+        chunk_rounds["total_workload"] = total_workload
+
+        impact_confidentiality = severity_table[chunk]
+        impact_confidentiality *= 1 - defense_modifier
+        np.maximum(impact_confidentiality, 0, out=chunk_rounds["impact_confidentiality"])
+        chunk_rounds["impact_integrity"] = chunk_rounds["impact_confidentiality"]
+
+        impact_availability = total_workload - defense_modifier * 0.6
+        np.maximum(impact_availability, 0, out=impact_availability)
+        impact_availability[reset_table[chunk]] = 0.8
+        # Strengths and the modifier are non-negative, so the later low/medium DDoS attacks
+        # lower availability by their summed strength, floored at 0 once
+        lowering = irrational_codes[flagged] == 2
+        lowered_strength = lower_table[chunk]
+        lowered_strength += np.bincount(flagged[lowering] // n_attackers, weights=irrational_strength[lowering],
+                                        minlength=len(chunk))
+        impact_availability -= lowered_strength * defense_modifier * 0.2
+        np.maximum(impact_availability, 0, out=chunk_rounds["impact_availability"])
+    return attacks, rounds
+
+
+def _sample_states(weights, n, rng):
+    """
+    Draws n state indices with probabilities proportional to weights.
+
+    Same result as searchsorted() on the cumulative weights, but a guide table sends
+    each draw straight to (or just below) its state, which avoids a binary search per draw.
+    """
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+    cumulative[np.flatnonzero(weights)[-1]:] = np.inf  # Top-end rounding lands on the last possible state
+    n_guide = 4 * len(weights)
+    guide = np.searchsorted(cumulative, np.arange(n_guide) / n_guide * total, side="right")
+
+    u = rng.random(n)
+    states = guide[(u * n_guide).astype(np.intp)]
+    u *= total
+    pending = np.flatnonzero(cumulative[states] <= u)
+    while pending.size:
+        states[pending] += 1
+        pending = pending[cumulative[states[pending]] <= u[pending]]
+    return states
+
+
+def _resolve(active, outcome, malicious_score, defender_resources, category):
+    """
+    Applies the attack_round() arithmetic to attacker-major draws.
+
+    Args:
+        active (ndarray): (n_attackers, n_rounds) attacker selection.
+        outcome (ndarray): attack_type * len(Impact) + potential_impact per attacker and round.
+        malicious_score (ndarray): Maliciousness per attacker and round.
+        defender_resources (float): A value between 0 and 1 representing the defender's resources.
+        category (Category): The category of the defender (SME or SMB).
+
+    Returns:
+        tuple: (attacks, rounds) as returned by attack_rounds().
+    """
+    n_attackers, n_rounds = active.shape
+    attack_type = np.where(active, outcome // len(Impact), 0)
+    potential_impact = np.where(active, outcome % len(Impact), 0)
+    malicious_score = np.where(active, malicious_score, 0.0)
+    attack_strength = attack_intensity(malicious_score)
+    cvss_base_score = np.where(active, CVSS_BASE[attack_type, potential_impact], 0.0)
+
+    # Summed attacker by attacker to keep the floating point order of sum()
+    total_workload = np.zeros(n_rounds)
+    for k in range(n_attackers):
+        total_workload += attack_strength[k]
+    defense_modifier = defense_effectiveness(defender_resources, total_workload, category)
+    impact_modifier = 1 - defense_modifier
+
+    impact_availability = np.maximum(0, total_workload - defense_modifier * 0.6)
+    impact_confidentiality = np.zeros(n_rounds)
+    # Availability is overwritten attacker by attacker in pool order, so walk the attackers
+    for k in range(n_attackers):
+        is_sql = active[k] & (attack_type[k] == AttackType.SQL_INJECTION)
+        is_ddos = active[k] & (attack_type[k] == AttackType.DDOS)
+        is_high = potential_impact[k] == Impact.HIGH
+
+        sql_impact = np.where(is_high, cvss_base_score[k] * impact_modifier, cvss_base_score[k] * 0.5 * impact_modifier)
+        sql_hit = is_sql & (potential_impact[k] != Impact.LOW)
+        impact_confidentiality = np.where(sql_hit, np.maximum(impact_confidentiality, sql_impact), impact_confidentiality)
+
+        reduced = np.maximum(0, impact_availability - attack_strength[k] * defense_modifier * 0.2)
+        impact_availability = np.where(is_ddos & is_high, 0.8, np.where(is_ddos, reduced, impact_availability))
+
+    attacks = np.empty((n_rounds, n_attackers), dtype=ATTACK_DTYPE)
+    attacks["active"] = active.T
+    attacks["attack_type"] = attack_type.T
+    attacks["maliciousness"] = malicious_score.T
+    attacks["attack_strength"] = attack_strength.T
+    attacks["potential_impact"] = potential_impact.T
+    attacks["cvss_base_score"] = cvss_base_score.T
+
+    rounds = np.empty(n_rounds, dtype=ROUND_DTYPE)
+    rounds["total_workload"] = total_workload
+    rounds["impact_availability"] = impact_availability
+    rounds["impact_confidentiality"] = impact_confidentiality
+    rounds["impact_integrity"] = impact_confidentiality  # Integrity always follows confidentiality in attack_round()
+    return attacks, rounds
+
+
+def round_as_dict(attacks, rounds, index):
+    """
+    Rebuilds the dictionary returned by attack_round() for a single batched round.
+
+    Args:
+        attacks (ndarray): Attack array returned by attack_rounds().
+        rounds (ndarray): Round array returned by attack_rounds().
+        index (int): Round to convert.
+
+    Returns:
+        dict: A dictionary containing the results of the attack round.
+    """
+    attack_results = []
+    for attack in attacks[index]:
+        if attack["active"]:
+            attack_results.append({
+                "attack_type": ATTACK_TYPE_LABELS[attack["attack_type"]],
+                "maliciousness": float(attack["maliciousness"]),
+                "attack_strength": float(attack["attack_strength"]),
+                "potential_impact": IMPACT_LABELS[attack["potential_impact"]],
+                "cvss_base_score": float(attack["cvss_base_score"])
+            })
+    result = {"attack_results": attack_results}
+    for field in ROUND_DTYPE.names:
+        result[field] = float(rounds[index][field])
+    return result
+
+
+def benchmark(n_rounds=1_000_000, loop_rounds=50_000, defender_resources=0.7, repeat=3):
+    """
+    Times attack_rounds() against the per-round attack_round() loop for both attacker
+    pools, without and with the irrational behavior of SME-SMB-IRRATIONAL.py.
+
+    Args:
+        n_rounds (int): Rounds per timing.
+        loop_rounds (int): Rounds actually run through the loop; its time is scaled up to n_rounds.
+        defender_resources (float): A value between 0 and 1 representing the defender's resources.
+        repeat (int): Timings per method; the best one is reported.
+
+    Returns:
+        list: One dict per (category, irrational behavior) with the loop and batch times in
+        seconds and the speedup.
+    """
+    from dfr.sme_smb import attack_round, attacker_pools
+
+    def best_of(function):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    results = []
+    for category, attacker_pool in attacker_pools.items():
+        for irrational_behavior in (0.0, 0.8):
+            def loop():
+                for _ in range(loop_rounds):
+                    attack_round(attacker_pool, defender_resources, category, irrational_behavior)
+
+            random.seed(0)
+            loop_seconds = best_of(loop) * n_rounds / loop_rounds
+            batch_seconds = best_of(lambda: attack_rounds(attacker_pool, defender_resources, category, n_rounds,
+                                                          irrational_behavior, rng=0))
+            results.append({
+                "category": category,
+                "irrational_behavior": irrational_behavior,
+                "n_rounds": n_rounds,
+                "loop_seconds": loop_seconds,
+                "batch_seconds": batch_seconds,
+                "speedup": loop_seconds / batch_seconds,
+            })
+    return results
+
+
+def main():
+    for result in benchmark():
+        print(f"{result['category']} irrational_behavior={result['irrational_behavior']}: "
+              f"loop {result['loop_seconds']:.2f}s, batch {result['batch_seconds']:.3f}s, "
+              f"{result['speedup']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
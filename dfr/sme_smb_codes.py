@@ -0,0 +1,190 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Integer-coded SME/SMB model.
+
+Attacker types, categories, attack types and impacts are small integer enums and
+every model constant is a table indexed by those codes, so the simulation hot
+path is plain array indexing. The string-based functions at the bottom keep the
+signatures of SME-SMB.py and translate labels to codes on the way in.
+"""
+from enum import IntEnum
+
+import numpy as np
+
+
+class AttackerType(IntEnum):
+    SCRIPT_KIDDIE = 0
+    DISGRUNTLED_INSIDER = 1
+    ORGANIZED_CRIME = 2
+    NATION_STATE_ACTOR = 3
+
+
+class Category(IntEnum):
+    SME = 0
+    SMB = 1
+
+
+class AttackType(IntEnum):
+    DDOS = 0
+    SQL_INJECTION = 1
+
+
+class Impact(IntEnum):
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+
+# Labels used by the original scripts, indexed by code
+ATTACKER_TYPE_LABELS = ("Script Kiddie", "Disgruntled Insider", "Organized Crime", "Nation-State Actor")
+CATEGORY_LABELS = ("SME", "SMB")
+ATTACK_TYPE_LABELS = ("DDoS", "SQL Injection")
+IMPACT_LABELS = ("High", "Medium", "Low")
+
+# Fuzzy membership value of each attacker type
+ATTACKER_VALUES = np.array([0.5, 0.7, 0.8, 1.0])
+# maliciousness() multiplier per category (SMEs might attract less targeted attacks)
+CATEGORY_FACTORS = np.array([1.5, 2.0])
+# maliciousness() as a table indexed by [attacker_type, category]
+MALICIOUSNESS = ATTACKER_VALUES[:, None] * CATEGORY_FACTORS[None, :]
+# Base of the diminishing-returns term in defense_effectiveness() per category
+DEFENSE_BASE = np.array([0.7, 0.8])
+# estimate_cvss_base() as a table indexed by [attack_type, impact]
+CVSS_BASE = np.array([
+    [7.0, 0.0, 0.0],  # DDoS: only high impact overwhelms system resources
+    [9.0, 7.0, 0.0],  # SQL Injection: data exfiltration / potential exposure
+])
+# cvss_to_impact_label() thresholds, with the impact code of each bucket in ascending score order
+CVSS_THRESHOLDS = np.array([4.0, 7.0])
+CVSS_BUCKET_IMPACTS = np.array([Impact.LOW, Impact.MEDIUM, Impact.HIGH], dtype=np.int8)
+
+
+def _codes(labels):
+    # Accepts the label itself or its code (ints and enum members hash alike)
+    codes = {label: code for code, label in enumerate(labels)}
+    codes.update({code: code for code in range(len(labels))})
+    return codes
+
+
+_ATTACKER_TYPE_CODES = _codes(ATTACKER_TYPE_LABELS)
+_CATEGORY_CODES = _codes(CATEGORY_LABELS)
+_ATTACK_TYPE_CODES = _codes(ATTACK_TYPE_LABELS)
+_IMPACT_CODES = _codes(IMPACT_LABELS)
+
+# Nested-list copies of the tables for the scalar functions, where list indexing beats numpy
+_MALICIOUSNESS = MALICIOUSNESS.tolist()
+_DEFENSE_BASE = DEFENSE_BASE.tolist()
+_CVSS_BASE = CVSS_BASE.tolist()
+
+
+def _lookup(codes, value, message):
+    try:
+        return codes[value]
+    except (KeyError, TypeError):
+        raise ValueError(message) from None
+
+
+def attacker_type_code(attacker_type):
+    """
+    Translates an attacker type label (e.g. "Script Kiddie") or code to an AttackerType.
+    """
+    return AttackerType(_lookup(_ATTACKER_TYPE_CODES, attacker_type,
+                                "Invalid attacker type. Please refer to valid options."))
+
+
+def category_code(category):
+    """
+    Translates a category label ("SME" or "SMB") or code to a Category.
+    """
+    return Category(_lookup(_CATEGORY_CODES, category, "Invalid category. Choose 'SME' or 'SMB'."))
+
+
+def attack_type_code(attack_type):
+    """
+    Translates an attack type label ("DDoS" or "SQL Injection") or code to an AttackType.
+    """
+    return AttackType(_lookup(_ATTACK_TYPE_CODES, attack_type, "Invalid attack type."))
+
+
+def impact_code(impact):
+    """
+    Translates an impact label ("High", "Medium" or "Low") or code to an Impact.
+    """
+    return Impact(_lookup(_IMPACT_CODES, impact, "Invalid impact."))
+
+
+def cvss_to_impact_codes(cvss_score):
+    """
+    Array version of cvss_to_impact_label() returning Impact codes.
+    """
+    return CVSS_BUCKET_IMPACTS[np.searchsorted(CVSS_THRESHOLDS, cvss_score, side="right")]
+
+
+# String-compatible versions of the SME-SMB.py functions
+
+def attack_intensity(malicious_score):
+    return malicious_score * 1.5
+
+
+def maliciousness(attacker_type, category):
+    """
+    This function models the attacker's maliciousness based on attacker type and category (SME or SMB).
+
+    Args:
+        attacker_type (str or AttackerType): The attacker type.
+        category (str or Category): The category of the defender (SME or SMB).
+
+    Returns:
+        float: The attacker's malicious intent.
+    """
+    attacker_type = _lookup(_ATTACKER_TYPE_CODES, attacker_type, "Invalid attacker type. Please refer to valid options.")
+    category = _lookup(_CATEGORY_CODES, category, "Invalid category. Choose 'SME' or 'SMB'.")
+    return _MALICIOUSNESS[attacker_type][category]
+
+
+def defense_effectiveness(resources, workload, category):
+    """
+    This function calculates how effective the defender's resources are against the attack workload,
+    considering category-specific factors.
+
+    Args:
+        resources (float): A value between 0 and 1 representing the defender's resources.
+        workload (float): The total attack workload.
+        category (str or Category): The category of the defender (SME or SMB).
+
+    Returns:
+        float: A value between 0 and 1 representing the defense effectiveness.
+    """
+    if resources < 0.5:
+        return resources
+    category = _lookup(_CATEGORY_CODES, category, "Invalid category. Choose 'SME' or 'SMB'.")
+    return 1 - (1 - resources) * (_DEFENSE_BASE[category] - workload * 0.2)
+
+
+def estimate_cvss_base(attack_type, impact):
+    """
+    Simplified CVSS base score of an attack type and impact (see CVSS_BASE).
+
+    Unknown labels score 0.0 as in SME-SMB.py ("low severity for other scenarios");
+    only integer codes outside the enums raise ValueError.
+    """
+    if isinstance(attack_type, str) or isinstance(impact, str):
+        attack_type = _ATTACK_TYPE_CODES.get(attack_type, attack_type)
+        impact = _IMPACT_CODES.get(impact, impact)
+        if isinstance(attack_type, str) or isinstance(impact, str):
+            return 0.0
+    attack_type = _lookup(_ATTACK_TYPE_CODES, attack_type, "Invalid attack type.")
+    impact = _lookup(_IMPACT_CODES, impact, "Invalid impact.")
+    return _CVSS_BASE[attack_type][impact]
+
+
+def cvss_to_impact_label(cvss_score):
+    """
+    Translates a CVSS score to an impact label ("High", "Medium" or "Low").
+    """
+    if cvss_score >= CVSS_THRESHOLDS[1]:
+        return IMPACT_LABELS[Impact.HIGH]
+    elif cvss_score >= CVSS_THRESHOLDS[0]:
+        return IMPACT_LABELS[Impact.MEDIUM]
+    return IMPACT_LABELS[Impact.LOW]
@@ -0,0 +1,140 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Parameter sweep over the SME/SMB attack model.
+
+Each grid point (category, resources, attacker pool, irrational behavior) is an
+independent job for a process pool. Every job gets its own child of one
+SeedSequence, so results depend only on the seed and the grid, not on how many
+workers run them or in which order they finish.
+"""
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dfr.result_sink import RoundSink
+from dfr.sme_smb import attacker_pools as default_attacker_pools
+from dfr.sme_smb_batch import ROUND_DTYPE, attack_rounds
+
+
+def sweep_grid(categories=("SME", "SMB"), resources=(0.2, 1), attacker_pools=None, irrational_behavior=(0.0,)):
+    """
+    Builds the full grid of sweep points.
+
+    Args:
+        categories (iterable): Defender categories (SME or SMB).
+        resources (iterable): Defender resources between 0 and 1.
+        attacker_pools (dict): Named attacker pools to sweep over. None uses the
+            default pool of each point's category.
+        irrational_behavior (iterable): Irrational behavior chances.
+
+    Returns:
+        list: One dict per grid point with category, resources, pool_name, attacker_pool
+        and irrational_behavior.
+    """
+    grid = []
+    pools = list(attacker_pools.items()) if attacker_pools is not None else [(None, None)]
+    for category, resource, (pool_name, pool), irrational in itertools.product(
+            categories, resources, pools, irrational_behavior):
+        grid.append({
+            "category": category,
+            "resources": resource,
+            "pool_name": pool_name if pool is not None else category,
+            "attacker_pool": pool if pool is not None else default_attacker_pools[category],
+            "irrational_behavior": irrational,
+        })
+    return grid
+
+
+def run_point(point, n_rounds, seed, chunk_size=1_000_000, output_path=None):
+    """
+    Simulates one grid point and summarizes its rounds.
+
+    Args:
+        point (dict): Grid point from sweep_grid().
+        n_rounds (int): Rounds to simulate.
+        seed: SeedSequence (or seed) for this point's random stream.
+        chunk_size (int): Rounds simulated per batch, bounding memory use.
+        output_path (str): Optional .parquet/.csv file receiving every round.
+
+    Returns:
+        dict: The grid point parameters with mean and standard deviation of each round
+        field and the mean number of active attackers per round.
+    """
+    rng = np.random.default_rng(seed)
+    totals = np.zeros(len(ROUND_DTYPE.names))
+    squares = np.zeros(len(ROUND_DTYPE.names))
+    attackers = 0
+    sink = RoundSink(output_path) if output_path is not None else None
+    try:
+        for start in range(0, n_rounds, chunk_size):
+            attacks, rounds = attack_rounds(point["attacker_pool"], point["resources"], point["category"],
+                                            min(chunk_size, n_rounds - start),
+                                            irrational_behavior=point["irrational_behavior"], rng=rng)
+            values = rounds.view((np.float64, len(ROUND_DTYPE.names)))
+            totals += values.sum(axis=0)
+            squares += (values ** 2).sum(axis=0)
+            attackers += int(attacks["active"].sum())
+            if sink is not None:
+                sink.write(attacks, rounds)
+    finally:
+        if sink is not None:
+            sink.close()
+
+    summary = {key: value for key, value in point.items() if key != "attacker_pool"}
+    summary["n_rounds"] = n_rounds
+    summary["attackers_per_round"] = attackers / n_rounds
+    means = totals / n_rounds
+    stds = np.sqrt(np.maximum(squares / n_rounds - means ** 2, 0))
+    for name, mean, std in zip(ROUND_DTYPE.names, means, stds):
+        summary[name + "_mean"] = mean
+        summary[name + "_std"] = std
+    return summary
+
+
+def _run_job(job):
+    return run_point(*job)
+
+
+def run_sweep(grid, n_rounds, seed=0, processes=None, chunk_size=1_000_000, output_dir=None):
+    """
+    Runs every grid point in a process pool and merges the summaries.
+
+    Args:
+        grid (list): Grid points from sweep_grid().
+        n_rounds (int): Rounds simulated per grid point.
+        seed (int): Root seed; point i always uses child i of SeedSequence(seed).
+        processes (int): Worker processes, defaults to the number of CPUs. 1 runs in-process.
+        chunk_size (int): Rounds simulated per batch inside a worker.
+        output_dir (str): Optional directory receiving one Parquet file of rounds per point.
+
+    Returns:
+        DataFrame: One row per grid point, in grid order.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(grid))
+    jobs = []
+    for index, (point, point_seed) in enumerate(zip(grid, seeds)):
+        output_path = os.path.join(output_dir, f"point-{index}.parquet") if output_dir is not None else None
+        jobs.append((point, n_rounds, point_seed, chunk_size, output_path))
+
+    processes = processes or os.cpu_count()
+    if processes == 1:
+        summaries = [_run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            summaries = list(executor.map(_run_job, jobs))
+    return pd.DataFrame(summaries)
+
+
+def main():
+    # Grid around the hard-coded settings of SME-SMB.py and SME-SMB-IRRATIONAL.py
+    grid = sweep_grid(categories=("SME", "SMB"), resources=(0.2, 0.5, 0.8, 1), irrational_behavior=(0.0, 0.8))
+    results = run_sweep(grid, n_rounds=100_000, seed=0)
+    print(results.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#Author: Mehrnoush Vaseghipanah
+#Research paper
+"""
+Compiled threat-model scoring for model_based_defense() (defender-tactics.py).
+
+calculate_model_score() walks every model's data_points dict and looks up its
+membership function for every event. compile_threat_models() does those
+lookups once: every distinct (data point, low, mid, high) membership function
+of any model becomes one feature, indexed by the column of its data point, and
+the models become a (features, models) weight matrix. Scoring a batch of
+events is then one triangular-membership pass over the features and one
+matrix product.
+"""
+import numpy as np
+
+
+def triangular_membership(x, low, mid, high):
+    """
+    Array version of triangular_membership_function(), with the same closed bounds.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rising = (x - low) / (mid - low)
+        falling = (high - x) / (high - mid)
+    return np.where((x > low) & (x <= mid), rising, np.where((x > mid) & (x <= high), falling, 0.0))
+
+
+def compile_threat_models(threat_models):
+    """
+    Packs threat models into a CompiledThreatModels.
+
+    Args:
+        threat_models (list): Threat models as used by model_based_defense() (name,
+            data_points, membership_functions and threshold).
+
+    Returns:
+        CompiledThreatModels: Scoring engine for all models.
+    """
+    return CompiledThreatModels(threat_models)
+
+
+class CompiledThreatModels:
+    """
+    Matrix form of a list of threat models.
+
+    columns are the data points any model reads, in first-seen order. Feature k reads
+    column feature_columns[k] through the triangle (low[k], mid[k], high[k]), and
+    weights[k, m] is its weight in model m (0 where the model does not use it).
+    Models sharing a data point and membership function share the feature.
+    """
+
+    def __init__(self, threat_models):
+        self.names = tuple(model["name"] for model in threat_models)
+        self.thresholds = np.array([model["threshold"] for model in threat_models], dtype=np.float64)
+        columns = {}
+        features = {}
+        entries = []
+        for m, model in enumerate(threat_models):
+            for data_point, weight in model["data_points"].items():
+                membership_func = model["membership_functions"][data_point]
+                column = columns.setdefault(data_point, len(columns))
+                key = (column, membership_func["low"], membership_func["mid"], membership_func["high"])
+                entries.append((features.setdefault(key, len(features)), m, weight))
+        self.columns = tuple(columns)
+
+        parameters = np.array(list(features), dtype=np.float64).reshape(-1, 4)
+        self.feature_columns = parameters[:, 0].astype(np.intp)
+        self.low, self.mid, self.high = parameters[:, 1], parameters[:, 2], parameters[:, 3]
+        self.weights = np.zeros((len(features), len(self.names)))
+        for feature, m, weight in entries:
+            self.weights[feature, m] += weight
+        # Normalization of calculate_model_score(): max weight times total weight
+        self.norms = np.array([max(model["data_points"].values()) * sum(model["data_points"].values())
+                               for model in threat_models], dtype=np.float64)
+
+    def event_matrix(self, events):
+        """
+        (n_events, len(columns)) array of data point values; missing data points are 0.
+
+        Args:
+            events: A list of security_data dicts, or a mapping (e.g. a DataFrame) of
+                data point name -> array of values.
+        """
+        if isinstance(events, (list, tuple)):
+            return np.array([[event.get(column, 0) for column in self.columns] for event in events],
+                            dtype=np.float64).reshape(len(events), len(self.columns))
+        values = {column: np.atleast_1d(np.asarray(events[column], dtype=np.float64))
+                  for column in self.columns if column in events}
+        n_events = max((len(value) for value in values.values()), default=0)
+        matrix = np.zeros((n_events, len(self.columns)))
+        for c, column in enumerate(self.columns):
+            if column in values:
+                matrix[:, c] = values[column]
+        return matrix
+
+    def score(self, events, chunk_size=65536):
+        """
+        Score of every event against every model, as calculate_model_score().
+
+        Args:
+            events: See event_matrix(); an ndarray is taken as the event matrix itself.
+            chunk_size (int): Events scored together, bounding memory use.
+
+        Returns:
+            ndarray: (n_events, n_models) scores.
+        """
+        matrix = events if isinstance(events, np.ndarray) else self.event_matrix(events)
+        scores = np.empty((len(matrix), len(self.names)))
+        for start in range(0, len(matrix), chunk_size):
+            values = matrix[start:start + chunk_size, self.feature_columns]
+            membership = triangular_membership(values, self.low, self.mid, self.high)
+            scores[start:start + chunk_size] = membership @ self.weights
+        return scores / self.norms
+
+    def detect(self, events, chunk_size=65536):
+        """
+        Boolean (n_events, n_models) matrix of scores above each model's threshold.
+        """
+        return self.score(events, chunk_size) > self.thresholds
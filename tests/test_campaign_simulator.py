@@ -0,0 +1,31 @@
+import numpy as np
+
+from dfr import campaign_simulator
+from dfr.campaign_simulator import initial_state, step
+from dfr.defender_batch import restore
+from dfr.kill_chain import STAGE_NAMES
+
+
+def test_restore_costs_hardened_defender_less():
+    rng = np.random.default_rng(0)
+    hardened = np.full(10_000, 0.9)
+    weak = np.full(10_000, 0.05)
+    hardened_loss = hardened - restore(hardened, rng, scale=1)
+    weak_loss = weak - restore(weak, rng, scale=1)
+    assert hardened_loss.mean() < weak_loss.mean()
+
+
+def test_hardened_campaign_loses_less_after_impact(monkeypatch):
+    def impact_everywhere(n_campaigns, defender_posture, attacker_resources, attacker_motivation, rng=None):
+        return {"outcomes": np.ones((n_campaigns, len(STAGE_NAMES)), dtype=bool),
+                "attacker_resources": np.asarray(attacker_resources, dtype=np.float64)}
+
+    monkeypatch.setattr(campaign_simulator, "run_campaigns", impact_everywhere)
+    rng = np.random.default_rng(1)
+    # No training or awareness: harden() adds nothing, so the whole change is the recovery cost
+    levels = np.repeat([0.9, 0.05], 5_000)
+    state = initial_state(len(levels), training=0, awareness=0, hardening_level=levels)
+    before = state["hardening_level"].copy()
+    step(state, rng)
+    loss = before - state["hardening_level"]
+    assert loss[:5_000].mean() < 0.5 * loss[5_000:].mean()
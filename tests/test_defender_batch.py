@@ -0,0 +1,11 @@
+import numpy as np
+
+from dfr.defender_batch import defend
+
+
+def test_eviction_counts_only_successful_draws():
+    # security_value 0.5: detection chance 0.25 and, for a strength-0 attacker, eviction chance 0.5
+    result = defend(15.0 * np.ones(100_000), 0.0, 0.0, 0.0, rng=0, playbook=("detect", "evict"))
+    detected = result["detected"].sum()
+    assert detected > 0
+    assert abs(result["evicted"].sum() / detected - 0.5) < 0.02
@@ -0,0 +1,30 @@
+import numpy as np
+
+from dfr.evolutionary_game import has_converged, run_game
+
+
+def test_slow_linear_ramp_is_not_converged():
+    # Every step (2e-4) is within tolerance, but the series is still trending
+    ramp = 0.5 + 2e-4 * np.arange(50)
+    assert not has_converged([ramp], window=10, tolerance=1e-3)
+
+
+def test_flat_series_is_converged():
+    rng = np.random.default_rng(0)
+    flat = 0.5 + rng.uniform(-1e-4, 1e-4, 50)
+    assert has_converged([flat], window=10, tolerance=1e-3)
+
+
+def test_slow_ramp_per_replicate():
+    generations = np.arange(50)[:, None]
+    trajectories = 0.5 + np.array([2e-4, 0.0]) * generations
+    assert has_converged([trajectories], window=10, tolerance=1e-3).tolist() == [False, True]
+
+
+def test_game_stops_only_once_strategies_settle():
+    result = run_game(rng=0, n_generations=500, tolerance=1e-3)
+    generation = result["converged_generation"]
+    assert generation >= 0
+    for name in ("avg_attacker_strategy", "avg_defender_strategy"):
+        recent = result[name][generation - 10:generation + 1]
+        assert abs(recent[-1] - recent[0]) <= 1e-3
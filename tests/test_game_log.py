@@ -0,0 +1,19 @@
+import numpy as np
+
+from dfr.game_log import GameLog, severity_codes
+from dfr.readiness_training import SEVERITY_LABELS, cvss_to_severity
+
+
+def test_severity_codes_match_cvss_to_severity():
+    scores = np.array([np.nan, -1.0, 0.0, 0.1, 3.9, 4.0, 6.9, 7.0, 10.0])
+    expected = [SEVERITY_LABELS.index(cvss_to_severity(score)) for score in scores]
+    assert severity_codes(scores).tolist() == expected
+    assert SEVERITY_LABELS[severity_codes(np.nan)] == "Gray (Unknown)"
+
+
+def test_nan_vulnerability_is_counted_as_unknown():
+    log = GameLog()
+    log.extend([True, False], [1, 2], [3, 4], [0.5, 0.6], [0.1, 0.2], [np.nan, 8.0])
+    counts = log.summary()["severity_counts"]
+    assert counts["Gray (Unknown)"] == 1
+    assert counts["Red (High)"] == 1
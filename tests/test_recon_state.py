@@ -0,0 +1,18 @@
+import pytest
+
+from dfr.recon_state import ALL_SYSTEMS, FULL_RECON, NO_RECON, ReconInfo, SystemSet
+
+
+def test_shared_findings_are_immutable():
+    with pytest.raises(AttributeError):
+        FULL_RECON.vulnerabilities = 0
+    with pytest.raises(AttributeError):
+        ALL_SYSTEMS.mask = 0
+    assert FULL_RECON.vulnerability_count == 2
+    assert len(ALL_SYSTEMS) == 3
+
+
+def test_equal_findings_hash_equal():
+    assert hash(ReconInfo.from_dict(FULL_RECON.to_dict())) == hash(FULL_RECON)
+    assert hash(SystemSet.from_list(ALL_SYSTEMS.to_list())) == hash(ALL_SYSTEMS)
+    assert len({FULL_RECON, NO_RECON, ReconInfo()}) == 2